@@ -348,7 +348,7 @@ def cmd_export(args, config: Config, db: Database):
     else:
         # export.output 相对于 XDG 数据目录
         output = os.path.join(_get_data_dir(), config.export_output)
-    path = exporter.export(output)
+    path = exporter.export(output, force=args.force)
     print(f"已导出至: {path}")
 
 
@@ -431,8 +431,10 @@ def cmd_migrate(args, config: Config, db: Database):
             github_issue_id=raw.get("github_issue_id"),
         )
 
-        db.add_issue(issue)
+        db.add_issue(issue, commit=False)
         inserted += 1
+    # 全部条目在同一事务内写入，中途失败不留下部分迁移结果
+    db.commit()
 
     first_id = config.id_format.format(num=next_num - inserted)
     last_id = config.id_format.format(num=next_num - 1)
@@ -634,6 +636,7 @@ def build_parser() -> argparse.ArgumentParser:
     # ── export ──
     p_exp = subparsers.add_parser("export", help="生成 markdown")
     p_exp.add_argument("--output", help="输出路径（默认: 相对于 ISSUE_TRACKER_HOME 的 export.output）")
+    p_exp.add_argument("--force", action="store_true", help="忽略缓存，强制重新生成")
 
     # ── sync ──
     p_sync = subparsers.add_parser("sync", help="同步到 GitHub")
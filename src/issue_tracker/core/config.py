@@ -2,6 +2,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from typing import Any
 
 try:
@@ -12,6 +13,18 @@ except ImportError:
     sys.exit(1)
 
 
+def _load_yaml_cached(path: str) -> Any:
+    """读取并解析 YAML，按 (路径, mtime, 大小) 缓存，文件被改写即重新解析."""
+    st = os.stat(path)
+    return _parse_yaml(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 class Config:
     """项目配置管理类.
 
@@ -31,8 +44,8 @@ class Config:
         if not os.path.isfile(config_path):
             raise FileNotFoundError(f"配置文件不存在: {config_path}")
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            self._raw: dict[str, Any] = yaml.safe_load(f)
+        # 解析结果可能被多个 Config 实例共享，Config 只读不写 _raw
+        self._raw: dict[str, Any] = _load_yaml_cached(config_path)
 
         self._config_dir = os.path.dirname(os.path.abspath(config_path))
         self._validate()
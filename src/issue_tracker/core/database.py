@@ -1,6 +1,7 @@
 """SQLite 数据库 CRUD 封装层."""
 
 import sqlite3
+from functools import lru_cache
 from typing import Optional
 
 from .model import Issue
@@ -57,6 +58,39 @@ CREATE VIEW IF NOT EXISTS v_summary AS
     ORDER BY id;
 """
 
+# ── 语句缓存 ─────────────────────────────────────────────────────────────────
+# sqlite3 按 SQL 文本缓存已编译语句，固定文本才能命中
+
+_STATEMENT_CACHE_SIZE = 256
+
+_INSERT_COLUMNS_SQL = """
+    (id, title, priority, status, discovery_date, fix_date, file_path,
+     location, description, impact, fix_plan, estimated_hours,
+     actual_hours, phase, github_issue_id)
+    VALUES (:id, :title, :priority, :status, :discovery_date,
+            :fix_date, :file_path, :location, :description, :impact,
+            :fix_plan, :estimated_hours, :actual_hours, :phase,
+            :github_issue_id)"""
+
+_INSERT_ISSUE_SQL = "INSERT INTO issues" + _INSERT_COLUMNS_SQL
+_UPSERT_ISSUE_SQL = "INSERT OR REPLACE INTO issues" + _INSERT_COLUMNS_SQL
+
+# update_issue 允许更新的字段白名单
+_UPDATABLE_FIELDS = frozenset({
+    "title", "priority", "status", "discovery_date", "fix_date",
+    "file_path", "location", "description", "impact", "fix_plan",
+    "estimated_hours", "actual_hours", "phase", "github_issue_id",
+})
+
+
+@lru_cache(maxsize=64)
+def _update_sql(fields: tuple[str, ...]) -> str:
+    """按（已排序的）字段组合生成 UPDATE 语句，相同组合复用同一 SQL 文本."""
+    set_clauses = [f"{k} = ?" for k in fields]
+    # 自动更新 updated_at
+    set_clauses.append("updated_at = datetime('now')")
+    return f"UPDATE issues SET {', '.join(set_clauses)} WHERE id = ?"
+
 
 class Database:
     """SQLite 数据库操作封装.
@@ -71,7 +105,7 @@ class Database:
             db_path: SQLite 数据库文件路径
         """
         self.db_path = db_path
-        self._conn = sqlite3.connect(db_path)
+        self._conn = sqlite3.connect(db_path, cached_statements=_STATEMENT_CACHE_SIZE)
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA foreign_keys = ON;")
         self._init_schema()
@@ -85,50 +119,36 @@ class Database:
         """关闭数据库连接."""
         self._conn.close()
 
+    def commit(self):
+        """提交当前事务（配合写方法的 commit=False 批量写入）."""
+        self._conn.commit()
+
     # ── Issue CRUD ───────────────────────────────────────────────────────────
 
-    def add_issue(self, issue: Issue) -> None:
+    def add_issue(self, issue: Issue, *, commit: bool = True) -> None:
         """插入新问题条目.
 
         Args:
             issue: Issue 对象
+            commit: False 时不立即提交，由调用方批量写入后统一 commit()
 
         Raises:
             sqlite3.IntegrityError: 编号已存在
         """
-        d = issue.to_dict()
-        self._conn.execute(
-            """INSERT INTO issues
-               (id, title, priority, status, discovery_date, fix_date, file_path,
-                location, description, impact, fix_plan, estimated_hours,
-                actual_hours, phase, github_issue_id)
-               VALUES (:id, :title, :priority, :status, :discovery_date,
-                       :fix_date, :file_path, :location, :description, :impact,
-                       :fix_plan, :estimated_hours, :actual_hours, :phase,
-                       :github_issue_id)""",
-            d,
-        )
-        self._conn.commit()
+        self._conn.execute(_INSERT_ISSUE_SQL, issue.to_dict())
+        if commit:
+            self._conn.commit()
 
-    def upsert_issue(self, issue: Issue) -> None:
+    def upsert_issue(self, issue: Issue, *, commit: bool = True) -> None:
         """插入或更新问题条目（迁移时使用）.
 
         Args:
             issue: Issue 对象
+            commit: False 时不立即提交，由调用方批量写入后统一 commit()
         """
-        d = issue.to_dict()
-        self._conn.execute(
-            """INSERT OR REPLACE INTO issues
-               (id, title, priority, status, discovery_date, fix_date, file_path,
-                location, description, impact, fix_plan, estimated_hours,
-                actual_hours, phase, github_issue_id)
-               VALUES (:id, :title, :priority, :status, :discovery_date,
-                       :fix_date, :file_path, :location, :description, :impact,
-                       :fix_plan, :estimated_hours, :actual_hours, :phase,
-                       :github_issue_id)""",
-            d,
-        )
-        self._conn.commit()
+        self._conn.execute(_UPSERT_ISSUE_SQL, issue.to_dict())
+        if commit:
+            self._conn.commit()
 
     def get_issue(self, issue_id: str) -> Optional[Issue]:
         """根据编号查询单条问题.
@@ -157,31 +177,14 @@ class Database:
         if not kwargs:
             return False
 
-        # 白名单过滤，仅允许更新已知字段
-        allowed = {
-            "title", "priority", "status", "discovery_date", "fix_date",
-            "file_path", "location", "description", "impact", "fix_plan",
-            "estimated_hours", "actual_hours", "phase", "github_issue_id",
-        }
-        filtered = {k: v for k, v in kwargs.items() if k in allowed}
-        if not filtered:
+        # 白名单过滤，仅允许更新已知字段；排序后同一字段组合对应同一 SQL
+        fields = tuple(sorted(k for k in kwargs if k in _UPDATABLE_FIELDS))
+        if not fields:
             return False
 
-        # 自动更新 updated_at
-        filtered["updated_at"] = "datetime('now')"
-
-        set_clauses = []
-        values = []
-        for k, v in filtered.items():
-            if k == "updated_at":
-                set_clauses.append(f"{k} = datetime('now')")
-            else:
-                set_clauses.append(f"{k} = ?")
-                values.append(v)
+        values = [kwargs[k] for k in fields]
         values.append(issue_id)
-
-        sql = f"UPDATE issues SET {', '.join(set_clauses)} WHERE id = ?"
-        cursor = self._conn.execute(sql, values)
+        cursor = self._conn.execute(_update_sql(fields), values)
         self._conn.commit()
         return cursor.rowcount > 0
 
@@ -215,8 +218,8 @@ class Database:
 
     # ── 查询 ─────────────────────────────────────────────────────────────────
 
-    def query_issues(
-        self,
+    @staticmethod
+    def _where_clause(
         *,
         issue_id: Optional[str] = None,
         priority: Optional[str] = None,
@@ -224,20 +227,8 @@ class Database:
         phase: Optional[str] = None,
         file_glob: Optional[str] = None,
         github_issue_id: Optional[int] = None,
-    ) -> list[Issue]:
-        """多条件过滤查询.
-
-        Args:
-            issue_id: 精确匹配编号
-            priority: 优先级过滤
-            status: 状态过滤
-            phase: 阶段过滤
-            file_glob: 文件路径 glob 匹配（如 src/hal/*）
-            github_issue_id: GitHub Issue 编号过滤
-
-        Returns:
-            匹配的 Issue 列表，按 priority ASC, discovery_date ASC 排序
-        """
+    ) -> tuple[str, list]:
+        """构造过滤条件，返回 (WHERE 子句, 参数列表)，供查询与计数共用."""
         conditions = []
         params: list = []
 
@@ -264,14 +255,64 @@ class Database:
             params.append(f"%{like_pattern}%")
 
         where_sql = " AND ".join(conditions) if conditions else "1=1"
+        return where_sql, params
+
+    def query_issues(
+        self,
+        *,
+        issue_id: Optional[str] = None,
+        priority: Optional[str] = None,
+        status: Optional[str] = None,
+        phase: Optional[str] = None,
+        file_glob: Optional[str] = None,
+        github_issue_id: Optional[int] = None,
+        order_by_id: bool = False,
+    ) -> list[Issue]:
+        """多条件过滤查询.
+
+        Args:
+            issue_id: 精确匹配编号
+            priority: 优先级过滤
+            status: 状态过滤
+            phase: 阶段过滤
+            file_glob: 文件路径 glob 匹配（如 src/hal/*）
+            github_issue_id: GitHub Issue 编号过滤
+            order_by_id: True 时按编号数值排序（非纯数字编号计为 0）
+
+        Returns:
+            匹配的 Issue 列表，默认按 priority ASC, discovery_date ASC 排序
+        """
+        where_sql, params = self._where_clause(
+            issue_id=issue_id, priority=priority, status=status, phase=phase,
+            file_glob=file_glob, github_issue_id=github_issue_id,
+        )
+        if order_by_id:
+            order_sql = "CAST(id AS INTEGER) ASC, priority ASC, discovery_date ASC"
+        else:
+            order_sql = "priority ASC, discovery_date ASC"
         sql = f"""
             SELECT * FROM issues
             WHERE {where_sql}
-            ORDER BY priority ASC, discovery_date ASC
+            ORDER BY {order_sql}
         """
         rows = self._conn.execute(sql, params).fetchall()
         return [Issue.from_row(dict(r)) for r in rows]
 
+    def count_issues(self, **filters) -> int:
+        """按与 query_issues 相同的过滤条件计数，不构造 Issue 对象.
+
+        Args:
+            **filters: issue_id / priority / status / phase / file_glob / github_issue_id
+
+        Returns:
+            匹配的条目数
+        """
+        where_sql, params = self._where_clause(**filters)
+        row = self._conn.execute(
+            f"SELECT COUNT(*) AS cnt FROM issues WHERE {where_sql}", params
+        ).fetchone()
+        return row["cnt"]
+
     # ── 统计 ─────────────────────────────────────────────────────────────────
 
     def get_stats(self) -> dict:
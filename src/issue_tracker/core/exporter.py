@@ -1,13 +1,19 @@
 """Export 逻辑: 从数据库生成 markdown 文件."""
 
+import hashlib
 import os
 from datetime import datetime
 
+from ..__version__ import __version__
 from .config import Config
 from .database import Database
 from .model import Issue
 
 
+# 导出格式版本: 修改 _generate / 模板 / 统计展示顺序等影响输出的逻辑时递增，
+# 与 __version__ 一同计入输入哈希，使升级后的首次导出不会复用旧文件
+_EXPORT_FORMAT_VERSION = 1
+
 # 状态符号映射
 STATUS_EMOJI = {
     "fixed": "✅ 已修复",
@@ -33,6 +39,80 @@ PRIORITY_LABELS = {
     "P3": "低 - 代码风格和最佳实践",
 }
 
+# 待修复问题优先级排序的分组标题
+PENDING_SECTION_TITLES = {
+    "P0": "紧急 (P0)",
+    "P1": "高 (P1)",
+    "P2": "中 (P2)",
+    "P3": "低 (P3)",
+}
+
+# 按优先级统计表的行标签与顺序
+STATISTICS_DISPLAY_ORDER = (
+    ("Critical (P0)", "P0"),
+    ("High     (P1)", "P1"),
+    ("Medium   (P2)", "P2"),
+    ("Low      (P3)", "P3"),
+)
+
+# 目录（静态内容，导入时拼接一次）
+_TOC_SECTION = "\n".join([
+    "## 目录",
+    "",
+    "- [文档格式规范](#文档格式规范)",
+    "  - [问题编号规则](#问题编号规则)",
+    "  - [问题条目格式](#问题条目格式)",
+    "- [总体统计](#总体统计)",
+    "  - [按优先级统计](#按优先级统计)",
+    "  - [问题概要汇总](#问题概要汇总)",
+    "- [Critical Priority (P0)](#critical-priority-p0)",
+    "- [High Priority (P1)](#high-priority-p1)",
+    "- [Medium Priority (P2)](#medium-priority-p2)",
+    "- [Low Priority (P3)](#low-priority-p3)",
+    "- [待修复问题优先级排序](#待修复问题优先级排序)",
+    "- [附录：问题分类统计](#附录问题分类统计)",
+    "",
+    "---",
+    "",
+])
+
+# 文档格式规范模板，仅优先级表格行随配置变化
+_FORMAT_SPEC_TEMPLATE = "\n".join([
+    "## 文档格式规范",
+    "",
+    "### 问题编号规则",
+    "",
+    "编号为全局自动递增序号（如 001, 002, 003...），由工具在新增或迁移时自动分配。",
+    "",
+    "| 优先级 | 含义 |",
+    # 每行自带前导换行，优先级列表为空时不留空行
+    "|--------|------|{priority_rows}",
+    "",
+    "### 问题条目格式",
+    "",
+    "```markdown",
+    "### 001: 问题标题 - ❌ 待修复/✅ 已修复",
+    "**发现日期**: YYYY-MM-DD",
+    "**文件**: `文件路径`",
+    "**位置**: 行号或代码位置",
+    "",
+    "**问题描述**:",
+    "问题的详细描述，包括代码示例(如有)。",
+    "",
+    "**影响**:",
+    "问题造成的影响。",
+    "",
+    "**修复方案**:",
+    "建议的修复方案，包括代码示例。",
+    "",
+    "**预计工时**: X 小时",
+    "**优先级**: P0/P1/P2/P3",
+    "```",
+    "",
+    "---",
+    "",
+])
+
 
 class Exporter:
     """从数据库导出 markdown 报告."""
@@ -41,11 +121,16 @@ class Exporter:
         self._config = config
         self._db = db
 
-    def export(self, output_path: str | None = None) -> str:
+    def export(self, output_path: str | None = None, force: bool = False) -> str:
         """生成 markdown 并写入文件.
 
+        输出文件旁保存一份输入内容的哈希（.<文件名>.hash），
+        数据、配置与导出格式均未变化且输出文件存在时直接跳过生成
+        （此时文件内的生成时间保持为上次生成的时间）。
+
         Args:
             output_path: 输出路径，None 时使用 config 中的默认值
+            force: True 时忽略哈希缓存，强制重新生成
 
         Returns:
             实际写入的文件路径
@@ -58,22 +143,45 @@ class Exporter:
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
 
-        content = self._generate()
+        # 按编号排序，后续各段分组时保持该顺序，无需再排序
+        all_issues = self._db.query_issues(order_by_id=True)
+        stats = self._db.get_stats()
+
+        hash_path = _hash_path(output_path)
+        key = self._input_hash(all_issues)
+        if not force and os.path.isfile(output_path) and _read_hash(hash_path) == key:
+            return output_path
+
+        content = self._generate(all_issues, stats)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # 整篇内容一次性编码后以二进制写入，避免文本层逐次编码
+        with open(output_path, "wb") as f:
+            f.write(content.encode("utf-8"))
+        with open(hash_path, "w", encoding="utf-8") as f:
+            f.write(key)
 
         return output_path
 
-    def _generate(self) -> str:
+    def _input_hash(self, all_issues: list[Issue]) -> str:
+        """计算影响导出内容的输入哈希（工具与格式版本、项目名、优先级列表与全部条目）.
+
+        updated_at 仅精确到秒，同一秒内的修改无法区分，因此按条目完整内容计算。
+        """
+        state = repr((
+            __version__, _EXPORT_FORMAT_VERSION,
+            self._config.project_name, self._config.valid_priorities, all_issues,
+        ))
+        return hashlib.blake2b(state.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _generate(self, all_issues: list[Issue], stats: dict) -> str:
         """生成完整的 markdown 内容."""
-        all_issues = self._db.query_issues()
-        stats = self._db.get_stats()
+        # 生成时间只格式化一次，头部和页脚共用
+        now = f"{datetime.now():%Y-%m-%d %H:%M}"
 
         sections = []
 
         # 头部元信息
-        sections.append(self._header(stats))
+        sections.append(self._header(stats, now))
 
         # 目录
         sections.append(self._toc())
@@ -97,14 +205,13 @@ class Exporter:
         sections.append(self._appendix(all_issues))
 
         # 页脚
-        sections.append(self._footer())
+        sections.append(self._footer(now))
 
         return "\n".join(sections)
 
     # ── 各段生成 ─────────────────────────────────────────────────────────────
 
-    def _header(self, stats: dict) -> str:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    def _header(self, stats: dict, now: str) -> str:
         total = stats["total"]
         fixed = stats["by_status"].get("fixed", 0)
         pending_count = total - fixed - stats["by_status"].get("n_a", 0)
@@ -121,68 +228,11 @@ class Exporter:
         return "\n".join(lines)
 
     def _toc(self) -> str:
-        lines = [
-            "## 目录",
-            "",
-            "- [文档格式规范](#文档格式规范)",
-            "  - [问题编号规则](#问题编号规则)",
-            "  - [问题条目格式](#问题条目格式)",
-            "- [总体统计](#总体统计)",
-            "  - [按优先级统计](#按优先级统计)",
-            "  - [问题概要汇总](#问题概要汇总)",
-            "- [Critical Priority (P0)](#critical-priority-p0)",
-            "- [High Priority (P1)](#high-priority-p1)",
-            "- [Medium Priority (P2)](#medium-priority-p2)",
-            "- [Low Priority (P3)](#low-priority-p3)",
-            "- [待修复问题优先级排序](#待修复问题优先级排序)",
-            "- [附录：问题分类统计](#附录问题分类统计)",
-            "",
-            "---",
-            "",
-        ]
-        return "\n".join(lines)
+        return _TOC_SECTION
 
     def _format_spec(self) -> str:
-        lines = [
-            "## 文档格式规范",
-            "",
-            "### 问题编号规则",
-            "",
-            "编号为全局自动递增序号（如 001, 002, 003...），由工具在新增或迁移时自动分配。",
-            "",
-            "| 优先级 | 含义 |",
-            "|--------|------|",
-        ]
-        for p in self._config.valid_priorities:
-            label = PRIORITY_LABELS.get(p, p)
-            lines.append(f"| {p} | {label} |")
-        lines.extend([
-            "",
-            "### 问题条目格式",
-            "",
-            "```markdown",
-            "### 001: 问题标题 - ❌ 待修复/✅ 已修复",
-            "**发现日期**: YYYY-MM-DD",
-            "**文件**: `文件路径`",
-            "**位置**: 行号或代码位置",
-            "",
-            "**问题描述**:",
-            "问题的详细描述，包括代码示例(如有)。",
-            "",
-            "**影响**:",
-            "问题造成的影响。",
-            "",
-            "**修复方案**:",
-            "建议的修复方案，包括代码示例。",
-            "",
-            "**预计工时**: X 小时",
-            "**优先级**: P0/P1/P2/P3",
-            "```",
-            "",
-            "---",
-            "",
-        ])
-        return "\n".join(lines)
+        rows = "".join(f"\n| {p} | {PRIORITY_LABELS.get(p, p)} |" for p in self._config.valid_priorities)
+        return _FORMAT_SPEC_TEMPLATE.format(priority_rows=rows)
 
     def _statistics(self, all_issues: list[Issue], stats: dict) -> str:
         lines = [
@@ -197,18 +247,11 @@ class Exporter:
         # 按优先级分组统计
         grouped = self._group_issues(all_issues)
 
-        display_order = [
-            ("Critical (P0)", "P0"),
-            ("High     (P1)", "P1"),
-            ("Medium   (P2)", "P2"),
-            ("Low      (P3)", "P3"),
-        ]
-
         grand_total = 0
         grand_fixed = 0
         grand_pending = 0
 
-        for label, key in display_order:
+        for label, key in STATISTICS_DISPLAY_ORDER:
             issues_in_group = grouped.get(key, [])
             total = len(issues_in_group)
             fixed = sum(1 for i in issues_in_group if i.status == "fixed")
@@ -239,10 +282,9 @@ class Exporter:
             "|------|----------|--------|----------|------|",
         ])
 
-        # 按编号排序输出概要表
-        for issue in sorted(all_issues, key=lambda i: self._sort_key(i.id)):
-            status_emoji = STATUS_EMOJI.get(issue.status, issue.status)
-            lines.append(f"| {issue.id} | {issue.title} | {issue.priority} | {issue.discovery_date} | {status_emoji} |")
+        # 按编号输出概要表（all_issues 已按编号排序）
+        if all_issues:
+            lines.append("\n".join(map(_summary_row, all_issues)))
 
         lines.extend(["", "---", ""])
         return "\n".join(lines)
@@ -266,7 +308,7 @@ class Exporter:
 
         lines = [title_with_progress, ""]
 
-        for issue in sorted(issues, key=lambda i: self._sort_key(i.id)):
+        for issue in issues:
             lines.append(self._format_issue(issue))
             lines.append("---")
             lines.append("")
@@ -290,10 +332,9 @@ class Exporter:
             if p not in prio_groups:
                 continue
             group = prio_groups[p]
-            label_map = {"P0": "紧急 (P0)", "P1": "高 (P1)", "P2": "中 (P2)", "P3": "低 (P3)"}
-            lines.append(f"### {label_map[p]}")
+            lines.append(f"### {PENDING_SECTION_TITLES[p]}")
             total_hours = sum(i.estimated_hours or 0 for i in group)
-            for idx, issue in enumerate(sorted(group, key=lambda i: self._sort_key(i.id)), 1):
+            for idx, issue in enumerate(group, 1):
                 status_emoji = STATUS_EMOJI.get(issue.status, issue.status)
                 hours_str = f" ({issue.estimated_hours}h)" if issue.estimated_hours else ""
                 lines.append(f"{idx}. **{issue.id}**: {issue.title}{hours_str} {status_emoji}")
@@ -333,8 +374,7 @@ class Exporter:
         lines.extend(["", "---", ""])
         return "\n".join(lines)
 
-    def _footer(self) -> str:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    def _footer(self, now: str) -> str:
         return "\n".join([
             "---",
             "",
@@ -485,18 +525,31 @@ class Exporter:
 
         return "\n".join(result)
 
-    @staticmethod
-    def _sort_key(issue_id: str) -> int:
-        """编号排序键: 按数字值排序."""
-        try:
-            return int(issue_id)
-        except ValueError:
-            return 0
-
 
 # ── 模块级辅助函数 ───────────────────────────────────────────────────────────
 
 
+def _summary_row(issue: Issue) -> str:
+    """问题概要汇总表的单行."""
+    return (f"| {issue.id} | {issue.title} | {issue.priority} | {issue.discovery_date} | "
+            f"{STATUS_EMOJI.get(issue.status, issue.status)} |")
+
+
+def _hash_path(output_path: str) -> str:
+    """导出哈希文件路径: 与输出文件同目录的 .<文件名>.hash."""
+    dir_name, base = os.path.split(output_path)
+    return os.path.join(dir_name, f".{base}.hash")
+
+
+def _read_hash(hash_path: str) -> str | None:
+    """读取上次导出的输入哈希，不存在时返回 None."""
+    try:
+        with open(hash_path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
 def _format_hours(hours: float) -> str:
     """格式化工时: 整数显示为 'X 小时'，小数保留一位."""
     if hours == int(hours):
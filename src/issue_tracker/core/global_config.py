@@ -7,12 +7,6 @@
 import os
 import sys
 
-try:
-    import yaml
-except ImportError:
-    print("错误: 需要 PyYAML。请执行: pip install pyyaml", file=sys.stderr)
-    sys.exit(1)
-
 from issue_tracker.core.paths import get_config_dir
 
 _GLOBALS_FILENAME = "globals.yaml"
@@ -24,6 +18,16 @@ _BUILTIN_DEFAULTS = {
 }
 
 
+def _yaml():
+    """按需导入 PyYAML；globals.yaml 不存在时无需加载."""
+    try:
+        import yaml
+    except ImportError:
+        print("错误: 需要 PyYAML。请执行: pip install pyyaml", file=sys.stderr)
+        sys.exit(1)
+    return yaml
+
+
 class GlobalConfig:
     """全局配置加载与保存.
 
@@ -40,7 +44,7 @@ class GlobalConfig:
     def _load(self) -> dict:
         if os.path.isfile(self.path):
             with open(self.path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                return _yaml().safe_load(f) or {}
         return {}
 
     def _defaults(self) -> dict:
@@ -49,7 +53,7 @@ class GlobalConfig:
     def _save(self):
         os.makedirs(os.path.dirname(self.path), exist_ok=True)
         with open(self.path, "w", encoding="utf-8") as f:
-            yaml.dump(self._data, f, default_flow_style=False, allow_unicode=True)
+            _yaml().dump(self._data, f, default_flow_style=False, allow_unicode=True)
 
     # ── 默认值读取 ────────────────────────────────────
 
@@ -4,9 +4,12 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Issue:
-    """单个问题条目的数据类."""
+    """单个问题条目的数据类.
+
+    不可变且无实例 __dict__；需要改动字段时用 dataclasses.replace 生成新对象。
+    """
 
     id: str                                  # 编号: C-001, M-037 等
     title: str                               # 标题
@@ -5,17 +5,26 @@ import os
 # 项目级配置文件名
 CONFIG_FILENAME = "issue-tracker.yaml"
 
+# XDG 默认基目录（导入时解析一次 HOME；环境变量仍在每次调用时读取）
+_HOME = os.path.expanduser("~")
+_DEFAULT_CONFIG_HOME = os.path.join(_HOME, ".config")
+_DEFAULT_DATA_HOME = os.path.join(_HOME, ".local", "share")
+_DEFAULT_CACHE_HOME = os.path.join(_HOME, ".cache")
+
 
 def get_config_dir() -> str:
     """项目配置目录: $XDG_CONFIG_HOME/issue-tracker (默认 ~/.config/issue-tracker)."""
-    base = os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config"))
-    return os.path.join(base, "issue-tracker")
+    return os.path.join(os.environ.get("XDG_CONFIG_HOME", _DEFAULT_CONFIG_HOME), "issue-tracker")
 
 
 def get_data_dir() -> str:
     """数据存储目录: $XDG_DATA_HOME/issue-tracker (默认 ~/.local/share/issue-tracker)."""
-    base = os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share"))
-    return os.path.join(base, "issue-tracker")
+    return os.path.join(os.environ.get("XDG_DATA_HOME", _DEFAULT_DATA_HOME), "issue-tracker")
+
+
+def get_cache_dir() -> str:
+    """缓存目录: $XDG_CACHE_HOME/issue-tracker (默认 ~/.cache/issue-tracker)，内容可随时删除."""
+    return os.path.join(os.environ.get("XDG_CACHE_HOME", _DEFAULT_CACHE_HOME), "issue-tracker")
 
 
 def get_backups_dir() -> str:
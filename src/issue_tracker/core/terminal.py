@@ -1,16 +1,20 @@
 """终端交互基础模块.
 
 提供 ANSI 配色、方向键菜单、是/否确认、彩色输入提示等组件。
-仅依赖 stdlib: os, re, select, sys, termios, tty, unicodedata
+仅依赖 stdlib: collections.abc, functools, os, re, select, signal, sys, termios, threading, tty, unicodedata
 """
 
 import os
 import re as _re
 import select
+import signal
 import sys
 import termios
+import threading
 import tty
 import unicodedata
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 
 
 # ── ANSI 转义常量 ─────────────────────────────────────────
@@ -29,9 +33,13 @@ class C:
     GRAY   = "\033[90m"
 
 
+# stdout 是否为 TTY，导入时判定一次，渲染循环内不再重复 isatty()
+_IS_TTY = sys.stdout.isatty()
+
+
 def c(text: str, *styles: str) -> str:
     """对文本施加样式，非 TTY 时原样返回."""
-    if not sys.stdout.isatty():
+    if not _IS_TTY:
         return text
     return "".join(styles) + text + C.RESET
 
@@ -55,94 +63,211 @@ class Key:
 # ── raw 单键读取 ──────────────────────────────────────────
 
 
+# CSI 序列末字节 → 键名（ESC [ X）
+_CSI_KEYS = {
+    "A": Key.UP,
+    "B": Key.DOWN,
+    "C": Key.RIGHT,
+    "D": Key.LEFT,
+    "Z": Key.BTAB,
+}
+
+# 单字节控制键 → 键名（Ctrl+C 单独处理）
+_SINGLE_KEYS = {
+    "\x04": Key.ESC,    # Ctrl+D
+    "\x0d": Key.ENTER,
+    "\x0a": Key.ENTER,
+    "\x09": Key.TAB,
+    "\x7f": Key.BS,     # Backspace
+}
+
+# 菜单移动键 → 光标方向
+_MENU_MOVES = {
+    Key.DOWN: 1,
+    Key.TAB:  1,
+    Key.UP:   -1,
+    Key.BTAB: -1,
+}
+
+# 是/否切换键 → choice（0=是, 1=否）
+_YES_NO_KEYS = {
+    Key.LEFT:  0,
+    Key.RIGHT: 1,
+}
+
+# ESC 之后预读多出的字节（ESC + 非 '[' 时），留给同一 raw 会话内的下一次读取
+_pending = ""
+
+
+class _RawMode:
+    """Raw 输入模式上下文，在整个按键循环期间只切换一次终端属性.
+
+    保留输出处理 (OPOST)，循环内重绘输出的换行仍回到行首。
+    """
+
+    def __enter__(self) -> int:
+        self.fd = sys.stdin.fileno()
+        self.old_settings = termios.tcgetattr(self.fd)
+        tty.setraw(self.fd)
+        attrs = termios.tcgetattr(self.fd)
+        attrs[1] |= termios.OPOST
+        termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+        return self.fd
+
+    def __exit__(self, *exc):
+        global _pending
+        # 预读字节只属于本次 raw 会话，离开时丢弃，不串入后续 input() 或菜单
+        _pending = ""
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+
+
 def getch() -> str:
     """Raw 模式单键读取 + CSI 序列解析.
 
     Ctrl+C 抛出 KeyboardInterrupt。
     使用 os.read(fd) + select([fd]) 避免 Python TextIOWrapper 缓冲干扰。
+    普通按键逐字节读取；仅在 ESC 之后一次读取 CSI 序列的剩余字节，
+    不会吞掉紧随其后键入的内容。
     """
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(fd)
+    with _RawMode() as fd:
+        return _getch_raw(fd)
+
+
+def _getch_raw(fd: int) -> str:
+    """在已处于 raw 模式的 fd 上读取单键（不切换终端属性）."""
+    global _pending
+    if _pending:
+        ch, _pending = _pending[0], _pending[1:]
+    else:
         ch = os.read(fd, 1).decode("latin-1")
+    if not ch:
+        return ""
 
-        if ch == "\x03":  # Ctrl+C
-            raise KeyboardInterrupt
+    if ch == "\x03":  # Ctrl+C
+        raise KeyboardInterrupt
 
-        if ch == "\x04":  # Ctrl+D
-            return Key.ESC
+    key = _SINGLE_KEYS.get(ch)
+    if key:
+        return key
 
-        if ch in ("\x0d", "\x0a"):  # Enter
-            return Key.ENTER
-
-        if ch == "\x09":  # Tab
-            return Key.TAB
-
-        if ch == "\x7f":  # Backspace
-            return Key.BS
-
-        if ch == "\x1b":
-            # select 用 fd 而非 sys.stdin，避免缓冲不一致
-            if select.select([fd], [], [], 0.1)[0]:
-                ch2 = os.read(fd, 1).decode("latin-1")
-                if ch2 == "[":
-                    if select.select([fd], [], [], 0.1)[0]:
-                        ch3 = os.read(fd, 1).decode("latin-1")
-                        if ch3 == "A":
-                            return Key.UP
-                        if ch3 == "B":
-                            return Key.DOWN
-                        if ch3 == "C":
-                            return Key.RIGHT
-                        if ch3 == "D":
-                            return Key.LEFT
-                        if ch3 == "Z":
-                            return Key.BTAB
-                        # 其他 CSI 序列忽略
-                        return ""
-                    return ""
-                # ESC + 非 '[' → 忽略
-                return ""
+    if ch == "\x1b":
+        # select 用 fd 而非 sys.stdin，避免缓冲不一致
+        # 最多预读一个 CSI 序列的剩余两字节 ("[X")
+        seq = os.read(fd, 2).decode("latin-1") if select.select([fd], [], [], 0.1)[0] else ""
+        if not seq:
             # 独立 ESC
             return Key.ESC
+        if seq[0] != "[":
+            # ESC + 非 '[' → 忽略，多读到的字节留给下一次读取
+            _pending = seq[1:]
+            return ""
+        if len(seq) < 2 and select.select([fd], [], [], 0.1)[0]:
+            seq += os.read(fd, 1).decode("latin-1")
+        # 其他 CSI 序列忽略
+        return _CSI_KEYS.get(seq[1:2], "")
 
-        return ch
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return ch
 
 
 # ── 宽度计算与终端尺寸 ────────────────────────────────────
 
 
+# ANSI SGR 序列（着色），计算宽度前剥离
+_ANSI_RE = _re.compile(r"\033\[[0-9;]*m")
+
+
+@lru_cache(maxsize=2048)
 def _visible_width(text: str) -> int:
-    """计算可见宽度，CJK 全角字符计 2，剥离 ANSI 序列."""
-    plain = _re.sub(r"\033\[[0-9;]*m", "", text)
-    w = 0
-    for ch in plain:
-        cat = unicodedata.east_asian_width(ch)
-        w += 2 if cat in ("W", "F") else 1
-    return w
+    """计算可见宽度，CJK 全角字符计 2，剥离 ANSI 序列.
+
+    菜单每次重绘都会重复测量相同的标题和选项，按文本缓存结果。
+    """
+    # 不含 ESC 的文本无需走正则
+    plain = _ANSI_RE.sub("", text) if "\x1b" in text else text
+    if plain.isascii():
+        return len(plain)
+    return sum(map(_char_width, plain))
+
+
+@lru_cache(maxsize=None)
+def _char_width(ch: str) -> int:
+    """单字符显示宽度: 东亚宽字符 (W/F) 计 2，其余计 1.
+
+    字符集有限，按字符缓存后重复出现的字符只需一次字典查找。
+    """
+    return 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+
+
+# 终端宽度缓存，窗口尺寸变化 (SIGWINCH) 时清空
+_term_width_cache: int | None = None
+
+# SIGWINCH 处理器安装状态: None=尚未尝试；安装前宿主进程的原处理器
+_winch_installed: bool | None = None
+_prev_winch_handler = None
+
+
+def _on_resize(signum, frame):
+    """SIGWINCH 处理: 使终端宽度缓存失效，再转交原处理器."""
+    global _term_width_cache
+    _term_width_cache = None
+    if callable(_prev_winch_handler):
+        _prev_winch_handler(signum, frame)
+
+
+def _install_winch_handler() -> bool:
+    """安装 SIGWINCH 处理器（须在主线程调用），返回是否成功.
+
+    不在导入时安装，避免静默替换宿主进程已有的处理器。
+    """
+    global _prev_winch_handler
+    try:
+        _prev_winch_handler = signal.signal(signal.SIGWINCH, _on_resize)
+    except (AttributeError, ValueError):
+        # 无 SIGWINCH 的平台 → 不缓存
+        return False
+    return True
 
 
 def _term_width() -> int:
-    """获取终端宽度，fallback 60."""
+    """获取终端宽度，fallback 60.
+
+    首次在主线程调用时安装 SIGWINCH 处理器，
+    此后结果缓存至下一次 SIGWINCH，避免每次渲染都执行 ioctl。
+    非主线程且尚未安装时每次重新测量。
+    """
+    global _term_width_cache, _winch_installed
+    if _term_width_cache is not None:
+        return _term_width_cache
+    if _winch_installed is None and threading.current_thread() is threading.main_thread():
+        _winch_installed = _install_winch_handler()
     try:
-        return os.get_terminal_size().columns
+        w = os.get_terminal_size().columns
     except (AttributeError, ValueError, OSError):
-        return 60
+        w = 60
+    if _winch_installed:
+        _term_width_cache = w
+    return w
 
 
 # ── 光标操作 ──────────────────────────────────────────────
 
 
 def _erase_above(n: int):
-    """上移 n 行并逐行清除."""
-    for _ in range(n):
-        sys.stdout.write("\033[A\033[2K")
+    """上移 n 行并逐行清除（单次 write）."""
+    sys.stdout.write(_erase_seq(n))
     sys.stdout.flush()
 
 
+def _erase_seq(n: int) -> str:
+    """上移 n 行并逐行清除的转义序列."""
+    return "\033[A\033[2K" * n
+
+
+# 隐藏 / 显示光标
+_HIDE_CURSOR = "\033[?25l"
+_SHOW_CURSOR = "\033[?25h"
+
+
 # ── 装饰区域配置 ──────────────────────────────────────────
 # 修改以下变量即可全局自定义顶部装饰文字和颜色
 
@@ -185,12 +310,47 @@ _ASCII_ART_LOGO_SIMPLE = [
 ]
 
 
+def _style_logo_line(line: str, elem_type: str) -> str:
+    """对单行 Logo 着色."""
+    if elem_type != "mixed":
+        # 边框使用深蓝色
+        return c(line, C.LOGO_BORDER, C.BOLD)
+    # 混合元素：分别渲染
+    # 分割: 边框部分 + 感叹号部分 + 对勾部分
+    # ║  ╷                       ╱           ║
+    # 分解为: ║(深蓝) + 空格 + ╷(浅蓝) + 空格 + ╱(亮蓝) + 空格 + ║(深蓝)
+    parts = []
+    for char in line:
+        if char in "║╔╗╚╝═":
+            parts.append(c(char, C.LOGO_BORDER, C.BOLD))
+        elif char == "╱":
+            parts.append(c(char, C.LOGO_CHECK, C.BOLD))
+        elif char in ("╷", "│", "└", "!", "●"):
+            parts.append(c(char, C.LOGO_EXCLAM, C.BOLD))
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+# 着色恒定，导入时预先生成各行；非 TTY 直接使用简化版
+if _IS_TTY:
+    _ASCII_ART_LOGO_STYLED = tuple(_style_logo_line(line, t) for line, t in _ASCII_ART_LOGO)
+else:
+    _ASCII_ART_LOGO_STYLED = tuple(_ASCII_ART_LOGO_SIMPLE)
+
+
 # ── 显示辅助 ──────────────────────────────────────────────
 
 
 def hr(ch: str = "─", color: str = C.CYAN) -> str:
     """返回一行水平线字符串."""
-    return c(ch * _term_width(), color)
+    return _hr(ch, color, _term_width())
+
+
+@lru_cache(maxsize=32)
+def _hr(ch: str, color: str, width: int) -> str:
+    """按 (字符, 颜色, 终端宽度) 缓存的水平线."""
+    return c(ch * width, color)
 
 
 def banner_line(text: str | None = None, color: str | None = None) -> str:
@@ -211,8 +371,8 @@ def banner_line(text: str | None = None, color: str | None = None) -> str:
     return c(line, color, C.DIM)
 
 
-def banner_block(version: str) -> list[str]:
-    """返回自定义 Logo ASCII 艺术装饰区块（多行）.
+def banner_block(version: str) -> Iterator[str]:
+    """逐行产出自定义 Logo ASCII 艺术装饰区块（多行）.
 
     返回格式:
         ╔══════════════════════════════════════╗
@@ -229,54 +389,29 @@ def banner_block(version: str) -> list[str]:
     参数:
         version: 版本号字符串，如 "2.2.5"
 
-    如果终端宽度小于 BANNER_MIN_WIDTH，返回空列表（不展示 banner）。
+    如果终端宽度小于 BANNER_MIN_WIDTH，不产出任何行（不展示 banner）。
+    需要列表时由调用方 list(...)。
     """
-    w = _term_width()
+    yield from _banner_block_cached(version, _term_width())
+
 
+@lru_cache(maxsize=8)
+def _banner_block_cached(version: str, w: int) -> tuple[str, ...]:
+    """按 (版本号, 终端宽度) 缓存的 banner 行，返回不可变 tuple."""
     # 窗口宽度检测
     if w < BANNER_MIN_WIDTH:
-        return []
-
-    lines = []
-    is_tty = sys.stdout.isatty()
-
-    if is_tty:
-        # 带颜色渲染
-        for line, elem_type in _ASCII_ART_LOGO:
-            if elem_type == "border":
-                # 边框使用深蓝色
-                lines.append(c(line, C.LOGO_BORDER, C.BOLD))
-            elif elem_type == "mixed":
-                # 混合元素：分别渲染
-                # 分割: 边框部分 + 感叹号部分 + 对勾部分
-                # ║  ╷                       ╱           ║
-                # 分解为: ║(深蓝) + 空格 + ╷(浅蓝) + 空格 + ╱(亮蓝) + 空格 + ║(深蓝)
-                parts = []
-                for char in line:
-                    if char == "║" or char == "╔" or char == "╗" or char == "╚" or char == "╝" or char == "═":
-                        parts.append(c(char, C.LOGO_BORDER, C.BOLD))
-                    elif char == "╱":
-                        parts.append(c(char, C.LOGO_CHECK, C.BOLD))
-                    elif char in ("╷", "│", "└", "!", "●"):
-                        parts.append(c(char, C.LOGO_EXCLAM, C.BOLD))
-                    else:
-                        parts.append(char)
-                lines.append("".join(parts))
-            else:
-                lines.append(c(line, C.LOGO_BORDER, C.BOLD))
-    else:
-        # 非 TTY 使用简化版
-        for line in _ASCII_ART_LOGO_SIMPLE:
-            lines.append(line)
+        return ()
+
+    lines = list(_ASCII_ART_LOGO_STYLED)
 
     # 版本行（左对齐，显示 "Issue Tracker vx.x.x"）
     version_line = f"   Issue Tracker v{version}"
-    lines.append(c(version_line, C.CYAN, C.BOLD) if is_tty else version_line)
+    lines.append(c(version_line, C.CYAN, C.BOLD))
 
     # 空行分隔
     lines.append("")
 
-    return lines
+    return tuple(lines)
 
 
 def title_bar(title: str):
@@ -284,12 +419,17 @@ def title_bar(title: str):
 
     格式: ══ title ════════ (CYAN Bold ═ 线 + WHITE Bold 标题)
     """
+    print(_title_bar_line(title))
+
+
+def _title_bar_line(title: str) -> str:
+    """返回标题栏字符串（不含换行）."""
     w = _term_width()
     title_text = f" {title} "
     title_w = _visible_width(title_text)
     left = 2
     right = max(1, w - left - title_w)
-    print(c("═" * left, C.CYAN, C.BOLD) + c(title_text, C.WHITE, C.BOLD) + c("═" * right, C.CYAN, C.BOLD))
+    return c("═" * left, C.CYAN, C.BOLD) + c(title_text, C.WHITE, C.BOLD) + c("═" * right, C.CYAN, C.BOLD)
 
 
 def section_header(title: str):
@@ -301,41 +441,67 @@ def section_header(title: str):
 
     颜色: ═ 线 CYAN Bold，标题 WHITE Bold
     """
-    w = _term_width()
-    bar = c("═" * w, C.CYAN, C.BOLD)
-    print(bar)
-    print(c(f"  {title}", C.WHITE, C.BOLD))
-    print(bar)
+    print_lines(section_header_lines(title))
 
 
+def section_header_lines(title: str) -> tuple[str, str, str]:
+    """返回 section_header 的三行（不含换行），供调用方拼入整屏输出."""
+    bar = c("═" * _term_width(), C.CYAN, C.BOLD)
+    return bar, c(f"  {title}", C.WHITE, C.BOLD), bar
+
+
+def print_lines(lines: Iterable[str]):
+    """整屏一次写出并 flush.
+
+    逐行 print 在行缓冲的终端上每行一次 write；SSH / tmux 下多行信息页
+    拆成多次刷新可见地变慢，合并为一次写入。
+    """
+    sys.stdout.write("".join(line + "\n" for line in lines))
+    sys.stdout.flush()
+
+
+# 常用样式组合的预拼接前缀
+_CYAN_BOLD  = C.CYAN + C.BOLD
+_WHITE_BOLD = C.WHITE + C.BOLD
+_GREEN_BOLD = C.GREEN + C.BOLD
+_RED_BOLD   = C.RED + C.BOLD
+_DIM_GRAY   = C.DIM + C.GRAY
+
+
+@lru_cache(maxsize=512)
 def label(text: str) -> str:
     """标签着色 (Cyan Bold)."""
-    return c(text, C.CYAN, C.BOLD)
+    return c(text, _CYAN_BOLD)
 
 
+@lru_cache(maxsize=512)
 def value(text: str) -> str:
     """值着色 (White Bold)."""
-    return c(text, C.WHITE, C.BOLD)
+    return c(text, _WHITE_BOLD)
 
 
+@lru_cache(maxsize=512)
 def ok(text: str) -> str:
     """成功绿色 (Green Bold)."""
-    return c(text, C.GREEN, C.BOLD)
+    return c(text, _GREEN_BOLD)
 
 
+@lru_cache(maxsize=512)
 def warn(text: str) -> str:
     """警告黄色."""
     return c(text, C.YELLOW)
 
 
+@lru_cache(maxsize=512)
 def err(text: str) -> str:
     """错误红色 (Red Bold)."""
-    return c(text, C.RED, C.BOLD)
+    return c(text, _RED_BOLD)
 
 
+@lru_cache(maxsize=512)
 def dim(text: str) -> str:
     """暗灰色 (Dim Gray)."""
-    return c(text, C.DIM, C.GRAY)
+    return c(text, _DIM_GRAY)
 
 
 # ── 交互组件 ──────────────────────────────────────────────
@@ -385,7 +551,7 @@ def menu(
     footer: str | None = None,
     separators: set[int] | None = None,
     item_colors: dict[int, str] | None = None,
-    header: list[str] | None = None,
+    header: Iterable[str] | None = None,
 ) -> int | None:
     """方向键菜单.
 
@@ -395,13 +561,15 @@ def menu(
         footer: 底部提示文字
         separators: 不可选的分隔行索引集合
         item_colors: 指定索引的未选中状态颜色
-        header: title_bar 之前输出的装饰行列表（参与重绘计算）
+        header: title_bar 之前输出的装饰行（可为生成器，参与重绘计算）
 
     返回:
         Enter → 选中索引 (int)；Esc/Ctrl+C → None
     """
     seps = separators or set()
     colors = item_colors or {}
+    # header 可能是生成器，只物化一次
+    header = tuple(header or ())
 
     # 初始 cursor 跳过 separators
     cursor = 0
@@ -420,61 +588,104 @@ def menu(
             steps += 1
         return nxt
 
-    def _render() -> int:
-        """渲染菜单，返回输出行数."""
-        lines = 0
-        # header 装饰行
-        if header:
-            for h in header:
-                print(h)
-                lines += 1
-        # title bar
-        title_bar(title)
-        lines += 1
-        # 选项
-        for i, opt in enumerate(options):
-            if i in seps:
-                # 分隔行
-                print("  " + dim("─" * (_term_width() - 4)))
-            elif i == cursor:
-                # 选中行: ▸ GREEN Bold + 文字 WHITE Bold
-                print("  " + c("▸ ", C.GREEN, C.BOLD) + c(opt, C.WHITE, C.BOLD))
-            else:
-                # 未选中行
-                col = colors.get(i, C.GRAY)
-                print("  " + c("  ", C.GRAY) + c(opt, col))
-            lines += 1
-        # footer
-        if footer:
-            print("  " + dim(footer))
-            lines += 1
-        return lines
+    # 静态帧缓存键: 菜单内容 + 终端宽度
+    frame_key = (
+        header, title, tuple(options), footer,
+        frozenset(seps), tuple(sorted(colors.items())),
+    )
+
+    def _selected_line(i: int) -> str:
+        """选中行: ▸ GREEN Bold + 文字 WHITE Bold."""
+        return "  " + c("▸ ", C.GREEN, C.BOLD) + c(options[i], C.WHITE, C.BOLD)
+
+    # 首个选项在帧内的行号（header 之后、title bar 之下）
+    first_row = len(header) + 1
+
+    def _render(static: tuple[str, ...], erase: int = 0) -> int:
+        """先清除上方 erase 行再整帧渲染（单次 write），返回输出行数."""
+        lines = list(static)
+        if options:
+            lines[first_row + cursor] = _selected_line(cursor)
+        sys.stdout.write(_erase_seq(erase) + "\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return len(lines)
+
+    def _rewrite(i: int, line: str) -> str:
+        """返回将第 i 个选项行原地改写为 line 的转义序列，光标回到帧下方."""
+        up = total_lines - (first_row + i)
+        return f"\033[{up}A\r\033[2K{line}\033[{up}B\r"
+
+    width = _term_width()
+    static = _menu_static_lines(*frame_key, width)
+    sys.stdout.write(_HIDE_CURSOR)
+    total_lines = _render(static)
 
-    total_lines = _render()
+    try:
+        with _RawMode() as fd:
+            while True:
+                try:
+                    key = _getch_raw(fd)
+                except KeyboardInterrupt:
+                    _erase_above(total_lines)
+                    return None
+
+                prev = cursor
+                if key == Key.ENTER:
+                    _erase_above(total_lines)
+                    return cursor
+                elif key == Key.ESC:
+                    _erase_above(total_lines)
+                    return None
+
+                direction = _MENU_MOVES.get(key)
+                if direction is None:
+                    continue
+                cursor = _next_idx(cursor, direction)
+
+                if _term_width() != width:
+                    # 终端尺寸变化: 重建静态行，清除与重绘合并为一次写入
+                    width = _term_width()
+                    static = _menu_static_lines(*frame_key, width)
+                    total_lines = _render(static, erase=total_lines)
+                elif cursor != prev:
+                    # 仅改写旧选中行与新选中行
+                    sys.stdout.write(_rewrite(prev, static[first_row + prev]) + _rewrite(cursor, _selected_line(cursor)))
+                    sys.stdout.flush()
+    finally:
+        sys.stdout.write(_SHOW_CURSOR)
+        sys.stdout.flush()
 
-    while True:
-        try:
-            key = getch()
-        except KeyboardInterrupt:
-            _erase_above(total_lines)
-            return None
-
-        if key == Key.ENTER:
-            _erase_above(total_lines)
-            return cursor
-        elif key == Key.ESC:
-            _erase_above(total_lines)
-            return None
-        elif key in (Key.DOWN, Key.TAB):
-            cursor = _next_idx(cursor, 1)
-        elif key in (Key.UP, Key.BTAB):
-            cursor = _next_idx(cursor, -1)
-        else:
-            continue
 
-        # 重绘
-        _erase_above(total_lines)
-        total_lines = _render()
+@lru_cache(maxsize=32)
+def _menu_static_lines(
+    header: tuple[str, ...],
+    title: str,
+    options: tuple[str, ...],
+    footer: str | None,
+    seps: frozenset[int],
+    colors: tuple[tuple[int, str], ...],
+    width: int,
+) -> tuple[str, ...]:
+    """构建 menu 整帧静态行（所有选项按未选中渲染）.
+
+    各级菜单在 while 循环中反复以相同内容调用 menu()，按内容与终端宽度缓存，
+    返回上层菜单时直接复用；选项文本随状态改变时键随之改变。
+    """
+    color_of = dict(colors)
+    sep_line = "  " + dim("─" * (width - 4))
+    lines = list(header)
+    lines.append(_title_bar_line(title))
+    for i, opt in enumerate(options):
+        if i in seps:
+            # 分隔行
+            lines.append(sep_line)
+        else:
+            # 未选中行
+            lines.append("  " + c("  ", C.GRAY) + c(opt, color_of.get(i, C.GRAY)))
+    # footer
+    if footer:
+        lines.append("  " + dim(footer))
+    return tuple(lines)
 
 
 def yes_no(prompt: str, default: bool = True) -> bool | None:
@@ -486,38 +697,59 @@ def yes_no(prompt: str, default: bool = True) -> bool | None:
     # choice: 0=是, 1=否
     choice = 0 if default else 1
 
-    def _render() -> int:
-        """渲染一行，返回行数(1)."""
+    prefix = "  " + c(prompt, C.CYAN, C.BOLD) + "   "
+    # 选项区起始列（1-based），切换时只从该列起改写
+    choice_col = _visible_width(prefix) + 1
+
+    def _choice_part() -> str:
+        """是/否 两个选项的着色字符串."""
         if choice == 0:
             yes_part = c("● 是", C.GREEN, C.BOLD)
             no_part  = c("○ 否", C.RED)
         else:
             yes_part = c("○ 是", C.GREEN)
             no_part  = c("● 否", C.RED, C.BOLD)
-        print("  " + c(prompt, C.CYAN, C.BOLD) + "   " + yes_part + "    " + no_part)
+        return yes_part + "    " + no_part
+
+    def _render(erase: int = 0) -> int:
+        """先清除上方 erase 行再渲染一行，返回行数(1)."""
+        sys.stdout.write(_erase_seq(erase) + prefix + _choice_part() + "\n")
+        sys.stdout.flush()
         return 1
 
+    width = _term_width()
+    sys.stdout.write(_HIDE_CURSOR)
     total_lines = _render()
 
-    while True:
-        try:
-            key = getch()
-        except KeyboardInterrupt:
-            _erase_above(total_lines)
-            return None
-
-        if key == Key.ENTER:
-            _erase_above(total_lines)
-            return choice == 0
-        elif key == Key.ESC:
-            _erase_above(total_lines)
-            return None
-        elif key == Key.LEFT:
-            choice = 0
-        elif key == Key.RIGHT:
-            choice = 1
-        else:
-            continue
-
-        _erase_above(total_lines)
-        total_lines = _render()
+    try:
+        with _RawMode() as fd:
+            while True:
+                try:
+                    key = _getch_raw(fd)
+                except KeyboardInterrupt:
+                    _erase_above(total_lines)
+                    return None
+
+                prev = choice
+                if key == Key.ENTER:
+                    _erase_above(total_lines)
+                    return choice == 0
+                elif key == Key.ESC:
+                    _erase_above(total_lines)
+                    return None
+
+                if key not in _YES_NO_KEYS:
+                    continue
+                choice = _YES_NO_KEYS[key]
+
+                if _term_width() != width:
+                    # 终端尺寸变化: 整行重绘
+                    width = _term_width()
+                    total_lines = _render(erase=total_lines)
+                elif choice != prev:
+                    # 回到上一行的选项区原地改写，prompt 不重绘
+                    sys.stdout.write(f"\033[A\033[{choice_col}G" + _choice_part() + "\033[K\033[B\r")
+                    sys.stdout.flush()
+    finally:
+        sys.stdout.write(_SHOW_CURSOR)
+        sys.stdout.flush()
@@ -1,15 +1,23 @@
 """迁移插件基类定义."""
 
-from abc import ABC, abstractmethod
+from collections import Counter
 
 
-class BaseMigrator(ABC):
-    """迁移插件抽象基类.
+# 必填字段
+_REQUIRED = ("id", "title", "priority", "status", "discovery_date")
+
+# 校验警告文本模板
+_MSG_MISSING = "[{}] 缺少必填字段: {}".format
+_MSG_DUP = "[{}] 编号重复".format
+
+
+class BaseMigrator:
+    """迁移插件基类.
 
     每个项目实现一个子类，负责解析项目特定的源文件格式。
+    子类必须覆盖 parse()；基类不使用 ABCMeta，避免实例化与 isinstance 的额外开销。
     """
 
-    @abstractmethod
     def parse(self, source_path: str) -> list[dict]:
         """解析源文件，返回 issue 字典列表.
 
@@ -30,19 +38,18 @@ class BaseMigrator(ABC):
         Returns:
             警告信息列表（空列表表示无问题）
         """
-        warnings = []
-        seen_ids = set()
-        for issue in issues:
-            issue_id = issue.get("id", "<missing>")
-
-            # 检查必填字段
-            for required in ("id", "title", "priority", "status", "discovery_date"):
-                if not issue.get(required):
-                    warnings.append(f"[{issue_id}] 缺少必填字段: {required}")
-
-            # 检查重复编号
-            if issue_id in seen_ids:
-                warnings.append(f"[{issue_id}] 编号重复")
-            seen_ids.add(issue_id)
+        ids = [issue.get("id", "<missing>") for issue in issues]
+
+        # 检查必填字段
+        warnings = [
+            _MSG_MISSING(issue_id, required)
+            for issue_id, issue in zip(ids, issues)
+            for required in _REQUIRED
+            if not issue.get(required)
+        ]
+
+        # 检查重复编号（首次出现之后的每次重复各报一条）
+        for issue_id, count in Counter(ids).items():
+            warnings.extend([_MSG_DUP(issue_id)] * (count - 1))
 
         return warnings
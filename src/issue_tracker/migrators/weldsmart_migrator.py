@@ -3,8 +3,12 @@
 解析 WeldSmart Pro 项目特定的 all-issues.md 格式，提取所有问题条目。
 """
 
+import io
+import os
 import re
-from typing import Optional
+import sys
+from collections.abc import Iterable
+from typing import Optional, TextIO
 
 from . import BaseMigrator
 
@@ -18,6 +22,9 @@ STATUS_SYMBOL_MAP = {
     "📋": "planned",
 }
 
+# 状态符号扫描（一次 search 取最先出现的符号）
+_STATUS_SYMBOL_RE = re.compile("|".join(map(re.escape, STATUS_SYMBOL_MAP)))
+
 # 编号前缀 → 阶段推断
 PREFIX_PHASE_MAP = {
     "C": "phase1_2",   # Critical 多来自 Phase 1-2 审查
@@ -38,6 +45,29 @@ PREFIX_PRIORITY_MAP = {
     "T": "P3",
 }
 
+# 新条目的字段模板（键序与 issues 表一致），每个标题行复制一份后填值
+_ISSUE_TEMPLATE = dict.fromkeys((
+    "id", "title", "priority", "status", "discovery_date", "fix_date",
+    "file_path", "location", "description", "impact", "fix_plan",
+    "estimated_hours", "actual_hours", "phase", "github_issue_id",
+))
+
+# 单行字段 **字段名**: 值 —— 一次匹配取出字段名与值，再按字段名分派
+_RE_FIELD = re.compile(
+    r"\*\*(?P<key>发现日期|文件|位置|预计工时|实际工时|优先级|状态|GitHub Issue)\*\*:\s*(?P<value>.+)"
+)
+_RE_STATUS_FIXED = re.compile(r"✅\s*(?:已修复|已完成)\s*\((\d{4}-\d{2}-\d{2})\)")
+_RE_GH = re.compile(r"#?(\d+)")
+_RE_BACKTICK = re.compile(r"`([^`]+)`")
+_RE_DATE = re.compile(r"\((\d{4}-\d{2}-\d{2})\)")
+
+# 多行字段开始标记前缀 → 字段名（冒号后有内容时同样视为字段开始）
+_MULTILINE_PREFIXES = (
+    ("**问题描述**:", "description"),
+    ("**影响**:", "impact"),
+    ("**修复方案", "fix_plan"),   # 含 **修复方案(待规划)**:
+)
+
 
 class WeldSmartMigrator(BaseMigrator):
     """解析 WeldSmart 的 all-issues.md 格式."""
@@ -49,32 +79,41 @@ class WeldSmartMigrator(BaseMigrator):
         r"(✅\s*(?:已修复|已完成)|❌\s*待修复|⚠️\s*不适用|🟢\s*进行中|📋\s*待规划)"
     )
 
-    def parse(self, source_path: str) -> list[dict]:
+    def parse(self, source: str | os.PathLike | TextIO) -> list[dict]:
         """解析 all-issues.md，返回 issue 字典列表.
 
         Args:
-            source_path: all-issues.md 文件路径
+            source: all-issues.md 文件路径（str / bytes / os.PathLike），
+                或已打开的文本流（如 io.StringIO）
 
         Returns:
             解析出的 issue 字典列表
         """
-        with open(source_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        lines = content.split("\n")
+        if isinstance(source, (str, bytes, os.PathLike)):
+            # 逐行读取，不整体读入再 split
+            with open(source, "r", encoding="utf-8") as f:
+                return self._parse_lines(f)
+        return self._parse_lines(source)
+
+    def _parse_lines(self, lines: Iterable[str]) -> list[dict]:
+        """逐行解析，lines 中每行可带或不带结尾换行符."""
         issues: list[dict] = []
         current_issue: dict | None = None
         # 用于收集多行字段的状态
         current_field: str | None = None
-        current_field_lines: list[str] = []
+        # 多行字段内容缓冲，跨条目复用，由 _flush_field 写入后清空
+        current_field_buf = io.StringIO()
+        # 类属性 TITLE_RE 供子类覆盖；循环外绑定一次，逐行不再经实例/类属性查找
+        match_title = self.TITLE_RE.match
 
         for line in lines:
-            # 尝试匹配标题行
-            title_match = self.TITLE_RE.match(line)
+            line = line.rstrip("\n")
+            # 尝试匹配标题行（只有 ### 开头的行可能是标题，其余行不走正则）
+            title_match = match_title(line) if line.startswith("###") else None
             if title_match:
                 # 保存之前的条目
                 if current_issue is not None:
-                    self._flush_field(current_issue, current_field, current_field_lines)
+                    self._flush_field(current_issue, current_field, current_field_buf)
                     issues.append(current_issue)
 
                 issue_id = title_match.group(1)
@@ -82,63 +121,58 @@ class WeldSmartMigrator(BaseMigrator):
                 status_text = title_match.group(3).strip()
                 status = self._parse_status(status_text)
 
-                prefix = issue_id.split("-")[0]
-                current_issue = {
-                    "id": issue_id,
-                    "title": title,
-                    "priority": PREFIX_PRIORITY_MAP.get(prefix, "P3"),
-                    "status": status,
-                    "discovery_date": None,
-                    "fix_date": None,
-                    "file_path": None,
-                    "location": None,
-                    "description": None,
-                    "impact": None,
-                    "fix_plan": None,
-                    "estimated_hours": None,
-                    "actual_hours": None,
-                    "phase": PREFIX_PHASE_MAP.get(prefix),
-                    "github_issue_id": None,
-                }
+                prefix = issue_id.partition("-")[0]
+                current_issue = _ISSUE_TEMPLATE.copy()
+                current_issue["id"] = issue_id
+                current_issue["title"] = title
+                current_issue["priority"] = PREFIX_PRIORITY_MAP.get(prefix, "P3")
+                current_issue["status"] = status
+                current_issue["phase"] = PREFIX_PHASE_MAP.get(prefix)
                 current_field = None
-                current_field_lines = []
                 continue
 
             if current_issue is None:
                 continue  # 标题之前的内容忽略
 
-            # 分隔线 → 结束当前多行字段
-            if line.strip() == "---":
-                self._flush_field(current_issue, current_field, current_field_lines)
-                current_field = None
-                current_field_lines = []
-                continue
+            # 分隔线与字段行去空白后以 - 或 * 开头；其余行（正文、空行）无需 strip
+            first = line[:1]
+            if first == "*" or first == "-" or first.isspace():
+                stripped = line.strip()
+            else:
+                stripped = line
 
-            # 解析单行字段
-            parsed = self._parse_single_line_field(current_issue, line)
-            if parsed:
-                # 单行字段解析成功，结束之前的多行字段
-                self._flush_field(current_issue, current_field, current_field_lines)
+            # 分隔线 → 结束当前多行字段
+            if stripped == "---":
+                self._flush_field(current_issue, current_field, current_field_buf)
                 current_field = None
-                current_field_lines = []
                 continue
 
-            # 检查多行字段的开始标记
-            multiline_field = self._detect_multiline_field_start(line)
-            if multiline_field:
-                # 结束之前的多行字段
-                self._flush_field(current_issue, current_field, current_field_lines)
-                current_field = multiline_field
-                current_field_lines = []
-                continue
+            # 单行字段与多行字段开始标记都以 ** 开头，其余行直接累积
+            if stripped.startswith("**"):
+                # 解析单行字段
+                parsed = self._parse_single_line_field(current_issue, stripped)
+                if parsed:
+                    # 单行字段解析成功，结束之前的多行字段
+                    self._flush_field(current_issue, current_field, current_field_buf)
+                    current_field = None
+                    continue
+
+                # 检查多行字段的开始标记
+                multiline_field = self._detect_multiline_field_start(stripped)
+                if multiline_field:
+                    # 结束之前的多行字段
+                    self._flush_field(current_issue, current_field, current_field_buf)
+                    current_field = multiline_field
+                    continue
 
             # 累积当前多行字段的内容
             if current_field and current_issue is not None:
-                current_field_lines.append(line)
+                current_field_buf.write(line)
+                current_field_buf.write("\n")
 
         # 处理最后一个条目
         if current_issue is not None:
-            self._flush_field(current_issue, current_field, current_field_lines)
+            self._flush_field(current_issue, current_field, current_field_buf)
             issues.append(current_issue)
 
         return issues
@@ -148,135 +182,51 @@ class WeldSmartMigrator(BaseMigrator):
     @staticmethod
     def _parse_status(status_text: str) -> str:
         """从状态文本解析状态枚举值."""
-        for symbol, status in STATUS_SYMBOL_MAP.items():
-            if symbol in status_text:
-                return status
-        return "pending"
+        m = _STATUS_SYMBOL_RE.search(status_text)
+        return STATUS_SYMBOL_MAP[m.group()] if m else "pending"
 
     @staticmethod
-    def _parse_single_line_field(issue: dict, line: str) -> bool:
+    def _parse_single_line_field(issue: dict, stripped: str) -> bool:
         """尝试解析单行 **字段**: 值 格式.
 
+        Args:
+            issue: 当前条目
+            stripped: 已去除首尾空白的行
+
         Returns:
             True 表示成功解析了单行字段
         """
-        stripped = line.strip()
-
-        # **发现日期**: YYYY-MM-DD
-        m = re.match(r"\*\*发现日期\*\*:\s*(.+)", stripped)
-        if m:
-            issue["discovery_date"] = m.group(1).strip()
-            return True
-
-        # **文件**: `路径` 或 多个路径
-        m = re.match(r"\*\*文件\*\*:\s*(.+)", stripped)
-        if m:
-            raw = m.group(1).strip()
-            # 去除反引号，提取路径
-            paths = re.findall(r"`([^`]+)`", raw)
-            if paths:
-                issue["file_path"] = ", ".join(paths)
-            else:
-                issue["file_path"] = raw
-            return True
-
-        # **位置**: 描述
-        m = re.match(r"\*\*位置\*\*:\s*(.+)", stripped)
-        if m:
-            issue["location"] = m.group(1).strip()
-            return True
-
-        # **预计工时**: X 小时 / Xh
-        m = re.match(r"\*\*预计工时\*\*:\s*(.+)", stripped)
-        if m:
-            issue["estimated_hours"] = _parse_hours(m.group(1).strip())
-            return True
-
-        # **实际工时**: X 小时 / Xh
-        m = re.match(r"\*\*实际工时\*\*:\s*(.+)", stripped)
-        if m:
-            issue["actual_hours"] = _parse_hours(m.group(1).strip())
-            return True
-
-        # **优先级**: PX
-        m = re.match(r"\*\*优先级\*\*:\s*(.+)", stripped)
-        if m:
-            issue["priority"] = m.group(1).strip()
-            return True
-
-        # **状态**: ✅ 已修复/已完成 (YYYY-MM-DD) → 提取 fix_date
-        m = re.match(r"\*\*状态\*\*:\s*✅\s*(?:已修复|已完成)\s*\((\d{4}-\d{2}-\d{2})\)", stripped)
-        if m:
-            issue["fix_date"] = m.group(1)
-            issue["status"] = "fixed"
-            return True
-
-        # **状态**: 其他状态（不带日期）
-        m = re.match(r"\*\*状态\*\*:\s*(.+)", stripped)
-        if m:
-            status_text = m.group(1).strip()
-            issue["status"] = WeldSmartMigrator._parse_status(status_text)
-            # 尝试提取状态后附带的日期
-            dm = re.search(r"\((\d{4}-\d{2}-\d{2})\)", status_text)
-            if dm and issue["status"] == "fixed":
-                issue["fix_date"] = dm.group(1)
-            return True
-
-        # **GitHub Issue**: #XXX
-        m = re.match(r"\*\*GitHub Issue\*\*:\s*#?(\d+)", stripped)
-        if m:
-            issue["github_issue_id"] = int(m.group(1))
-            return True
-
-        return False
+        m = _RE_FIELD.match(stripped)
+        if not m:
+            return False
+        return _FIELD_HANDLERS[m.group("key")](issue, m.group("value"))
 
     @staticmethod
-    def _detect_multiline_field_start(line: str) -> Optional[str]:
+    def _detect_multiline_field_start(stripped: str) -> Optional[str]:
         """检测多行字段的开始行（如 **问题描述**: 后面没有内容或仅有冒号）.
 
+        Args:
+            stripped: 已去除首尾空白的行
+
         Returns:
             字段名称（description/impact/fix_plan），或 None
         """
-        stripped = line.strip()
-        if stripped == "**问题描述**:" or stripped.startswith("**问题描述**:"):
-            # 检查冒号后是否有内容
-            after = stripped[len("**问题描述**:"):].strip()
-            if not after:
-                return "description"
-            # 有内容则不是多行字段开始（罕见情况，但处理一致）
-            return "description"
-        if stripped == "**影响**:" or stripped.startswith("**影响**:"):
-            after = stripped[len("**影响**:"):].strip()
-            if not after:
-                return "impact"
-            return "impact"
-        if stripped in ("**修复方案**:", "**修复方案(待规划)**:") or stripped.startswith("**修复方案"):
-            return "fix_plan"
+        for prefix, field in _MULTILINE_PREFIXES:
+            if stripped.startswith(prefix):
+                return field
         return None
 
     @staticmethod
-    def _flush_field(issue: dict, field: Optional[str], lines: list[str]):
-        """将累积的多行字段内容写入 issue 字典."""
-        if field is None or not lines:
+    def _flush_field(issue: dict, field: Optional[str], buf: io.StringIO):
+        """将缓冲区累积的多行字段内容写入 issue 字典，并清空缓冲区."""
+        text = buf.getvalue().strip()
+        buf.seek(0)
+        buf.truncate(0)
+        if field is None or not text:
             return
 
-        # 去除首尾空行
-        while lines and not lines[0].strip():
-            lines.pop(0)
-        while lines and not lines[-1].strip():
-            lines.pop()
-
-        if not lines:
-            return
-
-        text = "\n".join(lines).strip()
-
-        if field == "description":
-            issue["description"] = text
-        elif field == "impact":
-            issue["impact"] = text
-        elif field == "fix_plan":
-            issue["fix_plan"] = text
+        # field 取自 _MULTILINE_PREFIXES，与 issue 字典键同名
+        issue[field] = text
 
 
 # ── 模块级辅助函数 ───────────────────────────────────────────────────────────
@@ -287,11 +237,101 @@ def _parse_hours(text: str) -> Optional[float]:
 
     支持格式: "2 小时", "0.5 小时", "8h", "1 小时（需要 HAL 层支持）"
     """
-    # 提取第一个数字（含小数点）
-    m = re.match(r"([\d.]+)", text.strip())
+    # 提取开头连续的数字与小数点；isdecimal 与正则 \d 的匹配范围一致
+    s = text.lstrip()
+    i = 0
+    n = len(s)
+    while i < n and (s[i].isdecimal() or s[i] == "."):
+        i += 1
+    if not i:
+        return None
+    try:
+        return float(s[:i])
+    except ValueError:
+        return None
+
+
+# ── 单行字段处理 ─────────────────────────────────────────────────────────────
+# 每个处理函数接收 issue 字典与 **字段**: 之后的值，返回是否解析成功
+
+
+def _field_discovery_date(issue: dict, value: str) -> bool:
+    """**发现日期**: YYYY-MM-DD"""
+    issue["discovery_date"] = value.strip()
+    return True
+
+
+def _field_file(issue: dict, value: str) -> bool:
+    """**文件**: `路径` 或 多个路径"""
+    raw = value.strip()
+    # 去除反引号，提取路径
+    paths = _RE_BACKTICK.findall(raw)
+    if paths:
+        issue["file_path"] = ", ".join(paths)
+    else:
+        issue["file_path"] = raw
+    return True
+
+
+def _field_location(issue: dict, value: str) -> bool:
+    """**位置**: 描述"""
+    issue["location"] = value.strip()
+    return True
+
+
+def _field_estimated_hours(issue: dict, value: str) -> bool:
+    """**预计工时**: X 小时 / Xh"""
+    issue["estimated_hours"] = _parse_hours(value.strip())
+    return True
+
+
+def _field_actual_hours(issue: dict, value: str) -> bool:
+    """**实际工时**: X 小时 / Xh"""
+    issue["actual_hours"] = _parse_hours(value.strip())
+    return True
+
+
+def _field_priority(issue: dict, value: str) -> bool:
+    """**优先级**: PX（取值集合很小，驻留后与映射表中的字面量共享同一对象）"""
+    issue["priority"] = sys.intern(value.strip())
+    return True
+
+
+def _field_status(issue: dict, value: str) -> bool:
+    """**状态**: ✅ 已修复/已完成 (YYYY-MM-DD) → 提取 fix_date；其他状态按符号映射."""
+    m = _RE_STATUS_FIXED.match(value)
     if m:
-        try:
-            return float(m.group(1))
-        except ValueError:
-            return None
-    return None
+        issue["fix_date"] = m.group(1)
+        issue["status"] = "fixed"
+        return True
+
+    # 其他状态（不带日期）
+    status_text = value.strip()
+    issue["status"] = WeldSmartMigrator._parse_status(status_text)
+    # 尝试提取状态后附带的日期
+    dm = _RE_DATE.search(status_text)
+    if dm and issue["status"] == "fixed":
+        issue["fix_date"] = dm.group(1)
+    return True
+
+
+def _field_github_issue(issue: dict, value: str) -> bool:
+    """**GitHub Issue**: #XXX"""
+    m = _RE_GH.match(value)
+    if not m:
+        return False
+    issue["github_issue_id"] = int(m.group(1))
+    return True
+
+
+# 字段名 → 处理函数
+_FIELD_HANDLERS = {
+    "发现日期": _field_discovery_date,
+    "文件": _field_file,
+    "位置": _field_location,
+    "预计工时": _field_estimated_hours,
+    "实际工时": _field_actual_hours,
+    "优先级": _field_priority,
+    "状态": _field_status,
+    "GitHub Issue": _field_github_issue,
+}
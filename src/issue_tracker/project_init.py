@@ -8,17 +8,10 @@
     - 目录中无配置文件              → 引导式创建流程
 """
 
-import copy
 import os
 import re
 import sys
 
-try:
-    import yaml
-except ImportError:
-    print("错误: 需要 PyYAML。请执行: pip install pyyaml", file=sys.stderr)
-    sys.exit(1)
-
 from issue_tracker.__version__ import __version__
 from issue_tracker.core.global_config import GlobalConfig
 from issue_tracker.core.paths import CONFIG_FILENAME, ensure_directories
@@ -29,21 +22,46 @@ from issue_tracker.core.terminal import (
 
 
 def _banner():
-    """返回当前版本的装饰行列表（作为 menu header 传入）."""
+    """返回当前版本的装饰行（生成器，作为 menu header 传入）."""
     return banner_block(__version__)
 
 
 # ── 工具函数 ─────────────────────────────────────────────
 
 
+# ASCII 非单词字符 → "_"（与 [^\w] 在 ASCII 范围内一致）
+_SANITIZE_TABLE = {i: "_" for i in range(128) if not (chr(i).isalnum() or chr(i) == "_")}
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+
 def _sanitize_name(name: str) -> str:
-    """清理名称用于文件名: 保留字母数字和下划线."""
-    return re.sub(r'[^\w]', '_', name).strip('_')
+    """清理名称用于文件名: 保留字母数字和下划线.
+
+    纯 ASCII 名称走 str.translate，含中文等非 ASCII 字符时回退到正则。
+    """
+    if name.isascii():
+        return name.translate(_SANITIZE_TABLE).strip('_')
+    return _NON_WORD_RE.sub('_', name).strip('_')
+
+
+def _clone_config(data: dict) -> dict:
+    """复制配置字典供编辑: 顶层与各段的 dict/list 各复制一层.
+
+    配置结构固定为 段 → 标量/列表，编辑只改动段内的键，无需 deepcopy。
+    """
+    return {
+        k: dict(v) if isinstance(v, dict) else list(v) if isinstance(v, list) else v
+        for k, v in data.items()
+    }
 
 
 # ── YAML 渲染与 IO ───────────────────────────────────────
 
 
+# YAML 布尔字面量，按 bool 值索引
+_YAML_BOOL = ("false", "true")
+
+
 def render_yaml(data: dict) -> str:
     """生成与项目配置风格一致的 YAML 字符串.
 
@@ -56,11 +74,17 @@ def render_yaml(data: dict) -> str:
     statuses = data.get("statuses", ["pending", "in_progress", "planned", "fixed", "n_a"])
     id_format = data.get("id_rules", {}).get("format", "{num:03d}")
     template = gh.get("comment_template", "自动同步: {issue_id} 已修复")
+    proj_id = proj.get("id", "001")
+    proj_name = proj.get("name", "Project")
+    enabled = _YAML_BOOL[bool(gh.get("enabled", False))]
+    close_on_fix = _YAML_BOOL[bool(gh.get("close_on_fix", False))]
+    repo = gh.get("repo")
+    output = export.get("output", "exports/issues.md")
 
     lines = [
         'project:',
-        f'  id: "{proj.get("id", "001")}"',
-        f'  name: "{proj.get("name", "Project")}"',
+        f'  id: "{proj_id}"',
+        f'  name: "{proj_name}"',
         '',
         'id_rules:',
         f'  format: "{id_format}"',
@@ -69,26 +93,39 @@ def render_yaml(data: dict) -> str:
         f'statuses: [{", ".join(statuses)}]',
         '',
         'github:',
-        f'  enabled: {"true" if gh.get("enabled", False) else "false"}',
-        f'  close_on_fix: {"true" if gh.get("close_on_fix", False) else "false"}',
+        f'  enabled: {enabled}',
+        f'  close_on_fix: {close_on_fix}',
         f'  comment_template: "{template}"',
     ]
-    if gh.get("repo"):
-        lines.append(f'  repo: "{gh["repo"]}"')
+    if repo:
+        lines.append(f'  repo: "{repo}"')
     lines.extend([
         '',
         'export:',
-        f'  output: "{export.get("output", "exports/issues.md")}"',
+        f'  output: "{output}"',
         '',
     ])
     return "\n".join(lines)
 
 
 def load_yaml(path: str) -> dict | None:
-    """加载 YAML 文件为 dict."""
+    """加载 YAML 文件为 dict.
+
+    PyYAML 在此按需导入，新建配置的流程不需要解析 YAML。
+    """
+    try:
+        import yaml
+    except ImportError:
+        print("错误: 需要 PyYAML。请执行: pip install pyyaml", file=sys.stderr)
+        sys.exit(1)
+    # libyaml 可用时使用 C 实现的 SafeLoader
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
+        # 空文件无需进入解析器（空文档的解析结果同样是 None）
+        if os.path.getsize(path) == 0:
+            return None
         with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=loader)
     except Exception:
         return None
 
@@ -210,8 +247,8 @@ def guided_create(config_path: str):
 
 def edit_menu(config_path: str, data: dict):
     """编辑已有项目配置的菜单（Submit/Cancel 模式）."""
-    original = copy.deepcopy(data)
-    working  = copy.deepcopy(data)
+    original = _clone_config(data)
+    working  = _clone_config(data)
 
     # 菜单索引常量
     IDX_VIEW       = 0
@@ -255,8 +292,12 @@ def edit_menu(config_path: str, data: dict):
             return
 
         if choice == IDX_SUBMIT:
-            save_config(config_path, working)
-            print("  " + ok("✓ 已保存"))
+            # 无改动时不重写文件
+            if working != original:
+                save_config(config_path, working)
+                print("  " + ok("✓ 已保存"))
+            else:
+                print("  " + dim("配置无改动，未写入。"))
             wait_key()
             return
 
@@ -12,13 +12,14 @@
     - [动态] 当前项目配置（仅当 cwd 有 issue-tracker.yaml 时显示）
 """
 
-import copy
-import glob as glob_mod
+import json
 import os
-import subprocess
 import sys
-import tarfile
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from issue_tracker.__version__ import __version__
 from issue_tracker.core.global_config import GlobalConfig
@@ -26,21 +27,37 @@ from issue_tracker.core.paths import (
     ensure_directories,
     find_config_in_dir,
     get_backups_dir,
+    get_cache_dir,
     get_config_dir,
     get_data_dir,
 )
 from issue_tracker.core.terminal import (
-    C, banner_block, dim, err, input_line, label, menu, ok, section_header,
-    value, wait_key, warn, yes_no,
+    C, banner_block, dim, err, input_line, label, menu, ok, print_lines,
+    section_header, section_header_lines, value, wait_key, warn, yes_no,
 )
-from issue_tracker.project_init import edit_menu, load_yaml, save_config, _sanitize_name
+from issue_tracker.project_init import edit_menu, load_yaml, save_config, _clone_config, _sanitize_name
+
+if TYPE_CHECKING:
+    import subprocess
+
+# tarfile（连带 gzip/bz2/lzma）、subprocess、datetime 仅在备份 / 恢复 / gh 操作中用到，
+# 在对应函数内按需导入，不拖慢 iss-ui 启动
 
 
 def _banner():
-    """返回当前版本的装饰行列表（作为 menu header 传入）."""
+    """返回当前版本的装饰行（生成器，作为 menu header 传入）."""
     return banner_block(__version__)
 
 
+@lru_cache(maxsize=16)
+def _cwd_config(cwd: str) -> str | None:
+    """当前目录的项目配置路径，会话内按 cwd 只查找一次.
+
+    iss-ui 运行期间 cwd 不变，主菜单、路径查看与仓库绑定看到的结果保持一致。
+    """
+    return find_config_in_dir(cwd)
+
+
 # ── 查看当前路径 ─────────────────────────────────────────
 
 
@@ -48,27 +65,27 @@ def _view_paths():
     config_dir = get_config_dir()
     data_dir = get_data_dir()
     backups_dir = get_backups_dir()
-    cwd_config = find_config_in_dir(os.getcwd())
+    cwd_config = _cwd_config(os.getcwd())
 
     def _flag(path: str, is_dir: bool = False) -> str:
         check = os.path.isdir if is_dir else os.path.isfile
         return ok("✓") if check(path) else err("✗")
 
-    print()
-    section_header("当前路径")
-    print(f"  {label('配置目录:')}     {value(config_dir)}  [{_flag(config_dir, True)}]")
-    print(f"  {label('数据目录:')}     {value(data_dir)}  [{_flag(data_dir, True)}]")
-    print(f"  {label('备份目录:')}     {value(backups_dir)}  [{_flag(backups_dir, True)}]")
-    print()
-    print(f"  {label('当前工作目录:')} {value(os.getcwd())}")
-    if cwd_config:
-        print(f"  {label('项目配置:')}     {value(cwd_config)}  [{ok('✓')}]")
-    else:
-        print(f"  {label('项目配置:')}     {dim('(未找到)')}")
-    print()
-    print(f"  {label('XDG_CONFIG_HOME:')} {value(os.environ.get('XDG_CONFIG_HOME') or '(未设置，默认 ~/.config)')}")
-    print(f"  {label('XDG_DATA_HOME:')}   {value(os.environ.get('XDG_DATA_HOME') or '(未设置，默认 ~/.local/share)')}")
-    print()
+    print_lines([
+        "",
+        *section_header_lines("当前路径"),
+        f"  {label('配置目录:')}     {value(config_dir)}  [{_flag(config_dir, True)}]",
+        f"  {label('数据目录:')}     {value(data_dir)}  [{_flag(data_dir, True)}]",
+        f"  {label('备份目录:')}     {value(backups_dir)}  [{_flag(backups_dir, True)}]",
+        "",
+        f"  {label('当前工作目录:')} {value(os.getcwd())}",
+        f"  {label('项目配置:')}     {value(cwd_config)}  [{ok('✓')}]" if cwd_config
+        else f"  {label('项目配置:')}     {dim('(未找到)')}",
+        "",
+        f"  {label('XDG_CONFIG_HOME:')} {value(os.environ.get('XDG_CONFIG_HOME') or '(未设置，默认 ~/.config)')}",
+        f"  {label('XDG_DATA_HOME:')}   {value(os.environ.get('XDG_DATA_HOME') or '(未设置，默认 ~/.local/share)')}",
+        "",
+    ])
     wait_key()
 
 
@@ -83,7 +100,7 @@ def _global_config_menu():
         "statuses": list(gc.default_statuses),
         "template": gc.default_github_comment_template,
     }
-    working = copy.deepcopy(original)
+    working = _clone_config(original)
 
     # 菜单索引常量
     IDX_PRIORITIES = 0
@@ -158,11 +175,10 @@ def _global_config_menu():
 
 
 def _view_env_info():
-    print()
-    section_header("版本与环境信息")
-    print(f"  {label('issue-tracker 版本:')} {value(__version__)}")
-    print(f"  {label('Python 版本:')}        {value(sys.version.split()[0])}")
-    print(f"  {label('Python 路径:')}        {value(sys.executable)}")
+    import subprocess
+
+    # gh --version 在后台运行，与其余环境信息的收集并行
+    gh_version = _Prefetch(_run_gh, ["gh", "--version"], 3)
 
     # 安装方式判断
     try:
@@ -171,49 +187,201 @@ def _view_env_info():
         mode = "pip install" if "site-packages" in pkg_file else "开发模式"
     except Exception:
         mode = "未知"
-    print(f"  {label('安装方式:')}           {value(mode)}")
 
     # 依赖检查
-    print()
-    print(f"  {label('依赖状态:')}")
     try:
         import yaml  # noqa: F401
-        print(f"    {label('PyYAML:')}  {ok('✓')}")
+        yaml_line = f"    {label('PyYAML:')}  {ok('✓')}"
     except ImportError:
-        print(f"    {label('PyYAML:')}  {err('✗')}")
+        yaml_line = f"    {label('PyYAML:')}  {err('✗')}"
     try:
-        r = subprocess.run(["gh", "--version"], capture_output=True, text=True, timeout=3)
+        r = gh_version.result()
         ver = r.stdout.strip().split("\n")[0] if r.returncode == 0 else "?"
-        print(f"    {label('gh CLI:')}  {ok('✓')} ({ver})")
+        gh_line = f"    {label('gh CLI:')}  {ok('✓')} ({ver})"
     except (FileNotFoundError, subprocess.TimeoutExpired):
-        print(f"    {label('gh CLI:')}  {err('✗ 未安装或不可用')}")
-    print()
+        gh_line = f"    {label('gh CLI:')}  {err('✗ 未安装或不可用')}"
+
+    print_lines([
+        "",
+        *section_header_lines("版本与环境信息"),
+        f"  {label('issue-tracker 版本:')} {value(__version__)}",
+        f"  {label('Python 版本:')}        {value(sys.version.split()[0])}",
+        f"  {label('Python 路径:')}        {value(sys.executable)}",
+        f"  {label('安装方式:')}           {value(mode)}",
+        "",
+        f"  {label('依赖状态:')}",
+        yaml_line,
+        gh_line,
+        "",
+    ])
     wait_key()
 
 
 # ── 全局项目管理 ─────────────────────────────────────────
 
+# 备份按顺序流式写出、恢复按成员流式拷贝，均以 1 MiB 为块减少 read/write 调用；
+# 压缩级别取 gzip 命令行默认值，对 SQLite / YAML 内容体积与 9 级相差无几，CPU 开销明显更低
+_BACKUP_BUFSIZE = 1 << 20
+_BACKUP_GZIP_LEVEL = 6
+
+
+def _tar_member_kind(member) -> str:
+    """非普通文件成员的类型说明（恢复时跳过此类成员）."""
+    if member.isdir():
+        return "目录"
+    if member.issym():
+        return "符号链接"
+    if member.islnk():
+        return "硬链接"
+    return "特殊文件"
+
+
+def _scan_dir(directory: str, suffix: str) -> list[os.DirEntry]:
+    """单次 scandir 列出目录下指定后缀的普通文件（忽略隐藏文件），按路径排序."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith(suffix) and not e.name.startswith(".") and e.is_file()
+            ]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.path)
+    return entries
+
+
+# _scan_projects 结果缓存: (签名, 项目列表)
+# 签名由配置目录及各项目 yaml 的 mtime 组成，增删或改写任一配置即失效
+_projects_cache: tuple[tuple, list[dict]] | None = None
+
+
+# 跨会话的磁盘缓存: {yaml 路径: [mtime_ns, {"id", "name"}]}，位于 $XDG_CACHE_HOME
+_PROJECTS_CACHE_FILE = "projects.json"
+
+
+def _load_projects_disk_cache() -> dict[str, tuple[int, dict]]:
+    """读取磁盘上的项目扫描缓存；文件缺失或损坏时返回空字典（退化为全量解析）."""
+    path = os.path.join(get_cache_dir(), _PROJECTS_CACHE_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        return {p: (int(mtime_ns), {"id": entry["id"], "name": entry["name"]})
+                for p, (mtime_ns, entry) in raw.items()}
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def _save_projects_disk_cache(entries: dict[str, tuple[int, dict]]):
+    """原子写入项目扫描缓存（临时文件 + os.replace）；写入失败时静默跳过."""
+    cache_dir = get_cache_dir()
+    path = os.path.join(cache_dir, _PROJECTS_CACHE_FILE)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def _invalidate_projects_cache():
+    """本进程写入项目配置后主动清除缓存."""
+    global _projects_cache
+    _projects_cache = None
+
 
 def _scan_projects() -> list[dict]:
-    """扫描 XDG 配置目录中的所有项目配置."""
-    projects = []
-    for path in sorted(glob_mod.glob(os.path.join(get_config_dir(), "*.yaml"))):
-        if os.path.basename(path) == "globals.yaml":
-            continue
-        data = load_yaml(path)
+    """扫描 XDG 配置目录中的所有项目配置.
+
+    同一会话内多次进入项目相关菜单时，配置未变化则复用上次的解析结果；
+    跨会话经磁盘缓存复用 mtime 未变的条目，只重新解析有改动的配置文件。
+    """
+    global _projects_cache
+    config_dir = get_config_dir()
+    entries = [e for e in _scan_dir(config_dir, ".yaml") if e.name != "globals.yaml"]
+    paths = [e.path for e in entries]
+    try:
+        mtimes = [e.stat().st_mtime_ns for e in entries]
+        key = (config_dir, os.stat(config_dir).st_mtime_ns, tuple(zip(paths, mtimes)))
+    except OSError:
+        mtimes, key = None, None
+    if key is not None and _projects_cache is not None and _projects_cache[0] == key:
+        return list(_projects_cache[1])
+
+    disk = _load_projects_disk_cache() if mtimes is not None else {}
+    known: dict[str, dict] = {}
+    stale = []
+    for i, path in enumerate(paths):
+        hit = disk.get(path)
+        if hit is not None and hit[0] == mtimes[i]:
+            known[path] = hit[1]
+        else:
+            stale.append(path)
+
+    # 多个配置文件时并行读取解析，map 保持与 stale 相同的顺序
+    if len(stale) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+            datas = list(ex.map(load_yaml, stale))
+    else:
+        datas = [load_yaml(path) for path in stale]
+    for path, data in zip(stale, datas):
         proj = (data or {}).get("project", {})
-        projects.append({
-            "path": path,
+        known[path] = {
             "id": proj.get("id", "?"),
             "name": proj.get("name", os.path.basename(path)),
-        })
-    return projects
+        }
+
+    # 有重新解析或配置文件增删时回写磁盘缓存
+    if mtimes is not None and (stale or len(disk) != len(paths)):
+        _save_projects_disk_cache({p: (m, known[p]) for p, m in zip(paths, mtimes)})
+
+    projects = [{"path": path, **known[path]} for path in paths]
+    _projects_cache = (key, projects) if key is not None else None
+    return list(projects)
 
 
 def _find_db(proj: dict) -> str | None:
     """查找项目对应的数据库文件."""
-    matches = glob_mod.glob(os.path.join(get_data_dir(), f"{proj['id']}_*.db"))
-    return matches[0] if matches else None
+    data_dir = get_data_dir()
+    try:
+        mtime_ns = os.stat(data_dir).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _db_index(data_dir, mtime_ns).get(proj["id"])
+
+
+@lru_cache(maxsize=4)
+def _db_index(data_dir: str, mtime_ns: int | None) -> dict[str, str]:
+    """单次扫描数据目录，建立 项目 ID → 数据库路径 索引（<id>_*.db）.
+
+    按 (数据目录, 目录 mtime) 缓存，目录内增删文件即换新键。
+    """
+    index: dict[str, str] = {}
+    for e in _scan_dir(data_dir, ".db"):
+        project_id, sep, _ = e.name.partition("_")
+        if sep:
+            index.setdefault(project_id, e.path)
+    return index
+
+
+def _list_backups() -> list[str]:
+    """列出备份文件路径（按路径排序）."""
+    backups_dir = get_backups_dir()
+    try:
+        mtime_ns = os.stat(backups_dir).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return list(_backup_index(backups_dir, mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _backup_index(backups_dir: str, mtime_ns: int | None) -> tuple[str, ...]:
+    """按 (备份目录, 目录 mtime) 缓存的备份列表，新建备份即换新键."""
+    return tuple(e.path for e in _scan_dir(backups_dir, ".tar.gz"))
 
 
 def _project_mgmt_menu():
@@ -225,18 +393,23 @@ def _project_mgmt_menu():
             print("  " + dim("无项目配置。使用 iss-project 在项目目录创建。"))
             wait_key()
             return
-        section_header("当前项目列表")
+        lines = [*section_header_lines("当前项目列表")]
         for p in projects:
             db = _find_db(p)
             pid = p["id"]
             pname = p["name"]
-            print(f"  {label('[' + pid + ']')} {value(pname)}")
-            print(f"       {label('配置:')}   {value(p['path'])}")
-            print(f"       {label('数据库:')} {value(db) if db else dim('(无)')}")
-        print()
+            lines.append(f"  {label('[' + pid + ']')} {value(pname)}")
+            lines.append(f"       {label('配置:')}   {value(p['path'])}")
+            lines.append(f"       {label('数据库:')} {value(db) if db else dim('(无)')}")
+        lines.append("")
+        print_lines(lines)
         wait_key()
 
     def _backup():
+        import gzip
+        import tarfile
+        from datetime import datetime
+
         projects = _scan_projects()
         if not projects:
             print("  " + dim("无项目可备份。"))
@@ -258,7 +431,11 @@ def _project_mgmt_menu():
         backup_name = f"{proj['id']}_{safe_name}_{timestamp}.tar.gz"
         backup_path = os.path.join(get_backups_dir(), backup_name)
 
-        with tarfile.open(backup_path, "w:gz") as tar:
+        with (
+            open(backup_path, "wb", buffering=_BACKUP_BUFSIZE) as raw,
+            gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=_BACKUP_GZIP_LEVEL) as gz,
+            tarfile.open(fileobj=gz, mode="w|", bufsize=_BACKUP_BUFSIZE) as tar,
+        ):
             tar.add(proj["path"], arcname=os.path.basename(proj["path"]))
             if db_path:
                 tar.add(db_path, arcname=os.path.basename(db_path))
@@ -267,7 +444,9 @@ def _project_mgmt_menu():
         wait_key()
 
     def _restore():
-        backups = sorted(glob_mod.glob(os.path.join(get_backups_dir(), "*.tar.gz")))
+        import tarfile
+
+        backups = _list_backups()
         if not backups:
             print("  " + dim("无备份文件。"))
             wait_key()
@@ -280,43 +459,57 @@ def _project_mgmt_menu():
 
         backup_path = backups[choice]
 
-        # 预览内容（并验证路径安全性）
+        # 单次打开: 预览（并验证路径安全性）、确认、恢复共用同一 tar 句柄与成员列表
         print()
         section_header("备份内容预览")
-        unsafe_members = []
-        with tarfile.open(backup_path, "r:gz") as tar:
-            members = tar.getnames()
-            for m in members:
-                dest_dir = get_config_dir() if m.endswith(".yaml") else get_data_dir()
-                dest_path = os.path.realpath(os.path.join(dest_dir, m))
-                safe_prefix = os.path.realpath(dest_dir) + os.sep
-                if not dest_path.startswith(safe_prefix):
-                    unsafe_members.append(m)
-                    print(f"    {err('✗')} {value(m)} {err('(路径不安全，将跳过)')}")
-                else:
-                    print(f"    → {value(dest_path)}")
-        print()
-
-        # yes_no 确认
-        confirmed = yes_no("确认恢复?", default=False)
-        if not confirmed:
-            return
-
-        # 执行恢复（跳过不安全路径）
-        with tarfile.open(backup_path, "r:gz") as tar:
-            for member in tar.getmembers():
-                # 安全检查：验证路径不会逃逸到目标目录之外
-                dest_dir = get_config_dir() if member.name.endswith(".yaml") else get_data_dir()
-                dest_path = os.path.realpath(os.path.join(dest_dir, member.name))
-                safe_prefix = os.path.realpath(dest_dir) + os.sep
-                if not dest_path.startswith(safe_prefix):
-                    print("  " + err(f"✗ 跳过不安全路径: {member.name}"))
-                    continue
-                f = tar.extractfile(member)
-                if f:
-                    with open(dest_path, "wb") as out:
-                        out.write(f.read())
+        # 支持 extraction filter 的 tarfile（3.12，及 3.10.12 / 3.11.4 起的补丁版本）额外套用 "data" 过滤
+        extract_kw = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        # 目标目录及其安全前缀在成员循环外解析一次
+        config_dir, data_dir = get_config_dir(), get_data_dir()
+        safe_prefixes = {
+            config_dir: os.path.realpath(config_dir) + os.sep,
+            data_dir: os.path.realpath(data_dir) + os.sep,
+        }
+        try:
+            with tarfile.open(backup_path, "r:gz", copybufsize=_BACKUP_BUFSIZE) as tar:
+                plan = []  # (member, dest_dir, dest_path, 是否安全)
+                for member in tar.getmembers():
+                    dest_dir = config_dir if member.name.endswith(".yaml") else data_dir
+                    dest_path = os.path.realpath(os.path.join(dest_dir, member.name))
+                    safe = dest_path.startswith(safe_prefixes[dest_dir])
+                    plan.append((member, dest_dir, dest_path, safe))
+                    if not safe:
+                        print(f"    {err('✗')} {value(member.name)} {err('(路径不安全，将跳过)')}")
+                    elif not member.isfile():
+                        print(f"    {err('✗')} {value(member.name)} {err(f'({_tar_member_kind(member)}，将跳过)')}")
+                    else:
+                        print(f"    → {value(dest_path)}")
+                print()
+
+                # yes_no 确认
+                confirmed = yes_no("确认恢复?", default=False)
+                if not confirmed:
+                    return
+
+                # 执行恢复（跳过不安全路径与非普通文件，逐一提示）
+                for member, dest_dir, dest_path, safe in plan:
+                    if not safe:
+                        print("  " + err(f"✗ 跳过不安全路径: {member.name}"))
+                        continue
+                    if not member.isfile():
+                        print("  " + err(f"✗ 跳过{_tar_member_kind(member)}: {member.name}"))
+                        continue
+                    # 由 tarfile 按 copybufsize 分块拷贝到目标文件，不整体读入内存
+                    try:
+                        tar.extract(member, dest_dir, set_attrs=False, **extract_kw)
+                    except tarfile.TarError as e:
+                        # 含 "data" 过滤器拒绝成员时的 FilterError（TarError 子类）
+                        print("  " + err(f"✗ 跳过无法恢复的成员: {member.name} ({e})"))
+                        continue
                     print("  " + ok(f"✓ {dest_path}"))
+        except (tarfile.TarError, EOFError, OSError) as e:
+            # 备份文件损坏（非 gzip/tar 格式、截断），或写入目标目录失败
+            print("  " + err(f"✗ 恢复失败: {e}"))
         print()
         wait_key()
 
@@ -335,15 +528,67 @@ def _project_mgmt_menu():
 # ── GitHub 连接配置 ──────────────────────────────────────
 
 
+# gh 命令结果缓存: args → (时间戳, CompletedProcess)，TTL 内重复进入菜单直接复用
+_GH_CACHE_TTL = 30.0
+_gh_cache: dict[tuple[str, ...], tuple[float, "subprocess.CompletedProcess"]] = {}
+
+
+def _run_gh(args: list[str], timeout: float) -> "subprocess.CompletedProcess":
+    """运行 gh 命令并缓存结果.
+
+    只缓存成功 (returncode == 0) 的结果；FileNotFoundError / TimeoutExpired 原样抛出。
+    非零退出与异常均不缓存，下次进入时重试。
+    """
+    key = tuple(args)
+    now = time.monotonic()
+    hit = _gh_cache.get(key)
+    if hit and now - hit[0] < _GH_CACHE_TTL:
+        return hit[1]
+    import subprocess
+
+    # stdin 不继承终端: 后台运行时不与 raw 模式菜单争抢按键
+    result = subprocess.run(
+        args, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=timeout,
+    )
+    # 非零退出（如未登录）不缓存，用户执行 gh auth login 后重进菜单即可看到新状态
+    if result.returncode == 0:
+        _gh_cache[key] = (now, result)
+    return result
+
+
+class _Prefetch:
+    """在守护线程中提前执行一次调用，result() 等待并取回返回值或重新抛出异常.
+
+    与 ThreadPoolExecutor 不同，用户中途返回而放弃结果时，
+    后台调用不会在解释器退出时被 join，不拖慢退出。
+    """
+
+    def __init__(self, fn, *args):
+        self._value = None
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, args=(fn, args), daemon=True)
+        self._thread.start()
+
+    def _run(self, fn, args):
+        try:
+            self._value = fn(*args)
+        except BaseException as e:
+            self._error = e
+
+    def result(self):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
 def _github_config_menu():
+    import subprocess
 
     def _check_gh_login():
         print()
         try:
-            result = subprocess.run(
-                ["gh", "auth", "status"],
-                capture_output=True, text=True, timeout=5,
-            )
+            result = _run_gh(["gh", "auth", "status"], 5)
             output = (result.stdout + result.stderr).strip()
             for line in output.split("\n"):
                 if "logged in" in line.lower():
@@ -362,7 +607,7 @@ def _github_config_menu():
     def _bind_gh_repo():
         # 构建目标项目列表
         targets: list[tuple[str, str]] = []
-        cwd_config = find_config_in_dir(os.getcwd())
+        cwd_config = _cwd_config(os.getcwd())
         if cwd_config:
             targets.append(("当前目录项目", cwd_config))
         for p in _scan_projects():
@@ -375,6 +620,15 @@ def _github_config_menu():
             wait_key()
             return
 
+        # 仓库列表在后台预取，与用户选择目标项目的时间重叠；
+        # 按 Esc 放弃时守护线程自行结束，不阻塞退出
+        repos_prefetch = _Prefetch(
+            _run_gh,
+            ["gh", "repo", "list", "--limit", "30",
+             "--json", "nameWithOwner", "-q", ".[].nameWithOwner"],
+            10,
+        )
+
         # 选择目标项目
         proj_options = [t[0] for t in targets]
         choice = menu("选择目标项目", proj_options, header=_banner(), footer="↑↓ 选择  Enter 确认  Esc 返回")
@@ -385,11 +639,7 @@ def _github_config_menu():
         # 获取仓库列表
         print()
         try:
-            result = subprocess.run(
-                ["gh", "repo", "list", "--limit", "30",
-                 "--json", "nameWithOwner", "-q", ".[].nameWithOwner"],
-                capture_output=True, text=True, timeout=10,
-            )
+            result = repos_prefetch.result()
             if result.returncode != 0:
                 print("  " + err("✗ 无法获取仓库列表。请检查 gh 登录状态。"))
                 wait_key()
@@ -425,8 +675,12 @@ def _github_config_menu():
             print("  " + err(f"✗ 无法读取 {config_path}"))
             wait_key()
             return
-        data.setdefault("github", {})["repo"] = repo_name
-        save_config(config_path, data)
+        gh = data.setdefault("github", {})
+        # 已绑定同一仓库时不重写文件
+        if gh.get("repo") != repo_name:
+            gh["repo"] = repo_name
+            save_config(config_path, data)
+            _invalidate_projects_cache()
         print("  " + ok(f"✓ 已绑定 {repo_name} → {os.path.basename(config_path)}"))
         wait_key()
 
@@ -458,7 +712,7 @@ def main_ui():
     ]
 
     # 动态添加: 当前目录有项目配置时显示编辑菜单
-    cwd_config = find_config_in_dir(os.getcwd())
+    cwd_config = _cwd_config(os.getcwd())
     if cwd_config:
         def _current_project():
             data = load_yaml(cwd_config)
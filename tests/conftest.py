@@ -0,0 +1,15 @@
+"""pytest 会话级配置.
+
+本地开发模式（未 pip 安装）下把 src 加入 sys.path。conftest 在每个会话
+（及每个 xdist worker）中只执行一次，先于测试模块导入。
+python3 -m unittest 不加载本文件，测试模块自身仍保留同样的回退逻辑。
+"""
+
+import importlib.util
+import os
+import sys
+
+if importlib.util.find_spec("issue_tracker") is None:
+    SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
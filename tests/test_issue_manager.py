@@ -7,34 +7,42 @@
     本地模式: python3 -m unittest discover -s tests -v
 """
 
+import atexit
+import copy
+import io
+import json
 import os
+import pathlib
+import pty
+import shutil
+import signal
+import sqlite3
 import sys
 import tempfile
+import threading
+import types
 import unittest
-from unittest.mock import patch, MagicMock
 
 # ── 导入逻辑: 支持 pip 安装和本地开发模式 ────────────────────────────────
 
 try:
-    # pip 安装模式
-    from issue_tracker.core.config import Config
-    from issue_tracker.core.database import Database
-    from issue_tracker.core.model import Issue
-    from issue_tracker.core.exporter import Exporter
-    from issue_tracker.core.github_sync import GithubSync
-    from issue_tracker.migrators.weldsmart_migrator import WeldSmartMigrator
+    # pip 安装模式；pytest 下 conftest.py 已在会话开始时加入 src
+    import issue_tracker  # noqa: F401
 except ImportError:
-    # 本地开发模式: 添加 src 到路径
+    # 本地 unittest 模式: 添加 src 到路径
     SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     SRC_DIR = os.path.join(SCRIPT_DIR, "src")
     if SRC_DIR not in sys.path:
         sys.path.insert(0, SRC_DIR)
-    from issue_tracker.core.config import Config
-    from issue_tracker.core.database import Database
-    from issue_tracker.core.model import Issue
-    from issue_tracker.core.exporter import Exporter
-    from issue_tracker.core.github_sync import GithubSync
-    from issue_tracker.migrators.weldsmart_migrator import WeldSmartMigrator
+
+from issue_tracker import project_init, ui
+from issue_tracker.core import paths, terminal
+from issue_tracker.core.config import Config
+from issue_tracker.core.database import Database
+from issue_tracker.core.model import Issue
+from issue_tracker.core.exporter import Exporter
+from issue_tracker.core.github_sync import GithubSync
+from issue_tracker.migrators.weldsmart_migrator import WeldSmartMigrator
 
 
 # ── 辅助: 生成临时配置和数据库 ────────────────────────────────────────────────
@@ -76,17 +84,86 @@ statuses: [pending]
 """
 
 
-def _write_temp_config(content: str) -> str:
-    """写入临时配置文件并返回路径."""
-    fd, path = tempfile.mkstemp(suffix=".yaml")
-    with os.fdopen(fd, "w", encoding="utf-8") as f:
+# 临时配置优先放在内存文件系统（Linux /dev/shm），不可用时回退系统临时目录
+_TEMP_CONFIG_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+def _write_temp_config(content: str, test: unittest.TestCase | None = None) -> str:
+    """写入临时配置文件并返回路径；传入 test 时由其 addCleanup 负责删除."""
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".yaml", dir=_TEMP_CONFIG_DIR, delete=False,
+    ) as f:
         f.write(content)
-    return path
+    if test is not None:
+        test.addCleanup(os.unlink, f.name)
+    return f.name
+
+
+# 合法配置在整个测试模块内只写一次，各用例共享（Config 按文件 mtime 缓存解析结果）
+_SHARED_VALID_CONFIG_PATH = _write_temp_config(VALID_CONFIG_YAML)
+atexit.register(os.unlink, _SHARED_VALID_CONFIG_PATH)
+
+# 按 YAML 文本缓存 Config 实例: Config 只读，相同文本跨用例共享同一对象
+_config_cache: dict[str, Config] = {}
+
+
+def _get_config(yaml_text: str) -> Config:
+    """返回 yaml_text 对应的 Config，同一文本只写盘、解析一次."""
+    config = _config_cache.get(yaml_text)
+    if config is None:
+        if yaml_text == VALID_CONFIG_YAML:
+            path = _SHARED_VALID_CONFIG_PATH
+        else:
+            path = _write_temp_config(yaml_text)
+            atexit.register(os.unlink, path)
+        config = _config_cache[yaml_text] = Config(path)
+    return config
+
+
+# 内存库无需持久化保证: 关闭同步与共享锁开销（:memory: 日志模式固定为 memory，不再设置）
+_TEST_DB_PRAGMAS = """
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA locking_mode = EXCLUSIVE;
+"""
 
 
 def _make_db() -> Database:
     """创建内存数据库."""
-    return Database(":memory:")
+    db = Database(":memory:")
+    db._conn.executescript(_TEST_DB_PRAGMAS)
+    return db
+
+
+class _SharedDbTestCase(unittest.TestCase):
+    """类内共享一个内存数据库，每个用例前清空数据表.
+
+    Database 的写方法逐条 commit，无法用 SAVEPOINT 回滚隔离；
+    改为清表，省去逐用例重建连接与执行 schema DDL；
+    内存库的 close() 也只在 tearDownClass 执行一次。
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = _make_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.close()
+
+    def setUp(self):
+        self.db._conn.rollback()
+        self.db._conn.executescript(
+            "DELETE FROM github_sync_log; DELETE FROM issues; DELETE FROM sqlite_sequence;"
+        )
+
+
+def _bulk_add(db: Database, issues) -> None:
+    """在单个事务内批量插入测试数据."""
+    for issue in issues:
+        db.add_issue(issue, commit=False)
+    db.commit()
 
 
 def _sample_issue(issue_id="001", title="测试问题", priority="P2", status="pending") -> Issue:
@@ -102,6 +179,25 @@ def _sample_issue(issue_id="001", title="测试问题", priority="P2", status="p
     )
 
 
+# 夹具直写 issues 表的列，顺序与 _sample_row 返回的元组一致
+_SEED_COLUMNS = ("id", "title", "priority", "status", "discovery_date",
+                 "file_path", "location", "description")
+_SEED_SQL = (f"INSERT INTO issues ({', '.join(_SEED_COLUMNS)}) "
+             f"VALUES ({', '.join('?' * len(_SEED_COLUMNS))})")
+
+
+def _sample_row(issue_id="001", title="测试问题", priority="P2", status="pending",
+                discovery_date="2026-01-01", file_path="src/test.cpp") -> tuple:
+    """与 _sample_issue 相同默认值的原始行元组."""
+    return (issue_id, title, priority, status, discovery_date, file_path, "行 10", "测试描述")
+
+
+def _seed_raw(db: Database, rows: list[tuple]) -> None:
+    """以 executemany 直接写入只读查询用的夹具行，跳过 Issue 构建与逐条 add_issue."""
+    db._conn.executemany(_SEED_SQL, rows)
+    db.commit()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 配置测试
 # ══════════════════════════════════════════════════════════════════════════════
@@ -111,61 +207,51 @@ class TestConfig(unittest.TestCase):
     """配置加载与校验测试."""
 
     def test_load_valid_config(self):
-        path = _write_temp_config(VALID_CONFIG_YAML)
-        try:
-            config = Config(path)
-            self.assertEqual(config.project_id, "001")
-            self.assertEqual(config.project_name, "TestProject")
-            self.assertEqual(config.id_format, "{num:03d}")
-            self.assertTrue(config.is_valid_priority("P2"))
-            self.assertFalse(config.is_valid_priority("P99"))
-            self.assertTrue(config.is_valid_status("fixed"))
-            self.assertFalse(config.is_valid_status("unknown"))
-        finally:
-            os.unlink(path)
+        config = Config(_SHARED_VALID_CONFIG_PATH)
+        self.assertEqual(config.project_id, "001")
+        self.assertEqual(config.project_name, "TestProject")
+        self.assertEqual(config.id_format, "{num:03d}")
+        self.assertTrue(config.is_valid_priority("P2"))
+        self.assertFalse(config.is_valid_priority("P99"))
+        self.assertTrue(config.is_valid_status("fixed"))
+        self.assertFalse(config.is_valid_status("unknown"))
+
+    def test_reload_after_file_change(self):
+        """同一路径的配置文件被改写后重新解析，不返回旧的缓存结果."""
+        path = _write_temp_config(VALID_CONFIG_YAML, self)
+        self.assertEqual(Config(path).project_name, "TestProject")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(VALID_CONFIG_YAML.replace("TestProject", "Renamed"))
+        self.assertEqual(Config(path).project_name, "Renamed")
 
     def test_config_file_not_found(self):
         with self.assertRaises(FileNotFoundError):
             Config("/nonexistent/path/config.yaml")
 
     def test_config_missing_required_section(self):
-        path = _write_temp_config(INVALID_CONFIG_MISSING_PROJECT)
-        try:
-            with self.assertRaises(ValueError):
-                Config(path)
-        finally:
-            os.unlink(path)
+        path = _write_temp_config(INVALID_CONFIG_MISSING_PROJECT, self)
+        with self.assertRaises(ValueError):
+            Config(path)
 
     def test_config_missing_project_id(self):
-        path = _write_temp_config(INVALID_CONFIG_MISSING_PROJECT_ID)
-        try:
-            with self.assertRaises(ValueError):
-                Config(path)
-        finally:
-            os.unlink(path)
+        path = _write_temp_config(INVALID_CONFIG_MISSING_PROJECT_ID, self)
+        with self.assertRaises(ValueError):
+            Config(path)
 
     def test_is_valid_id(self):
-        path = _write_temp_config(VALID_CONFIG_YAML)
-        try:
-            config = Config(path)
-            self.assertTrue(config.is_valid_id("001"))
-            self.assertTrue(config.is_valid_id("037"))
-            self.assertTrue(config.is_valid_id("100"))
-            self.assertFalse(config.is_valid_id("C-001"))  # 旧前缀格式不合法
-            self.assertFalse(config.is_valid_id("abc"))    # 非数字
-            self.assertFalse(config.is_valid_id(""))       # 空字符串
-        finally:
-            os.unlink(path)
+        config = Config(_SHARED_VALID_CONFIG_PATH)
+        self.assertTrue(config.is_valid_id("001"))
+        self.assertTrue(config.is_valid_id("037"))
+        self.assertTrue(config.is_valid_id("100"))
+        self.assertFalse(config.is_valid_id("C-001"))  # 旧前缀格式不合法
+        self.assertFalse(config.is_valid_id("abc"))    # 非数字
+        self.assertFalse(config.is_valid_id(""))       # 空字符串
 
     def test_id_format_rendering(self):
-        path = _write_temp_config(VALID_CONFIG_YAML)
-        try:
-            config = Config(path)
-            self.assertEqual(config.id_format.format(num=1), "001")
-            self.assertEqual(config.id_format.format(num=42), "042")
-            self.assertEqual(config.id_format.format(num=1000), "1000")
-        finally:
-            os.unlink(path)
+        config = Config(_SHARED_VALID_CONFIG_PATH)
+        self.assertEqual(config.id_format.format(num=1), "001")
+        self.assertEqual(config.id_format.format(num=42), "042")
+        self.assertEqual(config.id_format.format(num=1000), "1000")
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -173,15 +259,9 @@ class TestConfig(unittest.TestCase):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestDatabaseCRUD(unittest.TestCase):
+class TestDatabaseCRUD(_SharedDbTestCase):
     """数据库增删改查测试."""
 
-    def setUp(self):
-        self.db = _make_db()
-
-    def tearDown(self):
-        self.db.close()
-
     def test_add_and_get(self):
         issue = _sample_issue("001", "临界问题", "P0", "pending")
         self.db.add_issue(issue)
@@ -197,7 +277,6 @@ class TestDatabaseCRUD(unittest.TestCase):
         self.assertIsNone(result)
 
     def test_add_duplicate_raises(self):
-        import sqlite3
         issue = _sample_issue("001")
         self.db.add_issue(issue)
         with self.assertRaises(sqlite3.IntegrityError):
@@ -246,21 +325,24 @@ class TestDatabaseCRUD(unittest.TestCase):
         result = self.db.get_issue("001")
         self.assertEqual(result.title, "更新后")
 
+    def test_add_without_commit(self):
+        """commit=False 的写入在 commit() 前可回滚，提交后持久."""
+        self.db.add_issue(_sample_issue("001"), commit=False)
+        self.db._conn.rollback()
+        self.assertIsNone(self.db.get_issue("001"))
+        _bulk_add(self.db, [_sample_issue("001"), _sample_issue("002")])
+        self.db._conn.rollback()
+        self.assertEqual(len(self.db.query_issues()), 2)
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 自动编号测试
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestDatabaseAutoId(unittest.TestCase):
+class TestDatabaseAutoId(_SharedDbTestCase):
     """自动编号 get_next_id() 测试."""
 
-    def setUp(self):
-        self.db = _make_db()
-
-    def tearDown(self):
-        self.db.close()
-
     def test_next_id_empty_db(self):
         """空数据库返回 1."""
         self.assertEqual(self.db.get_next_id(), 1)
@@ -305,34 +387,37 @@ class TestDatabaseAutoId(unittest.TestCase):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestDatabaseQuery(unittest.TestCase):
+class TestDatabaseQuery(_SharedDbTestCase):
     """查询与过滤测试."""
 
     def setUp(self):
-        self.db = _make_db()
+        super().setUp()
         # 插入测试数据
-        self.db.add_issue(_sample_issue("001", "临界A", "P0", "fixed"))
-        self.db.add_issue(_sample_issue("002", "中等A", "P2", "pending"))
-        self.db.add_issue(_sample_issue("003", "中等B", "P2", "fixed"))
-        self.db.add_issue(_sample_issue("004", "低等A", "P3", "planned"))
-        # 添加带不同文件路径的条目
-        issue_hal = Issue(
-            id="005", title="HAL问题", priority="P1", status="pending",
-            discovery_date="2026-01-15", file_path="src/hal/device/DeviceManager.cpp",
-        )
-        self.db.add_issue(issue_hal)
-
-    def tearDown(self):
-        self.db.close()
+        _seed_raw(self.db, [
+            _sample_row("001", "临界A", "P0", "fixed"),
+            _sample_row("002", "中等A", "P2", "pending"),
+            _sample_row("003", "中等B", "P2", "fixed"),
+            _sample_row("004", "低等A", "P3", "planned"),
+            # 带不同文件路径的条目
+            ("005", "HAL问题", "P1", "pending", "2026-01-15",
+             "src/hal/device/DeviceManager.cpp", None, None),
+        ])
 
     def test_query_by_priority(self):
         results = self.db.query_issues(priority="P2")
         self.assertEqual(len(results), 2)
         self.assertTrue(all(i.priority == "P2" for i in results))
 
+    def test_count_matches_query(self):
+        for filters in (
+            {}, {"priority": "P2"}, {"status": "pending"},
+            {"file_glob": "src/hal/*"}, {"issue_id": "404"},
+        ):
+            with self.subTest(**filters):
+                self.assertEqual(self.db.count_issues(**filters), len(self.db.query_issues(**filters)))
+
     def test_query_by_status(self):
-        results = self.db.query_issues(status="pending")
-        self.assertEqual(len(results), 2)  # 002 和 005
+        self.assertEqual(self.db.count_issues(status="pending"), 2)  # 002 和 005
 
     def test_query_by_id(self):
         results = self.db.query_issues(issue_id="001")
@@ -345,12 +430,16 @@ class TestDatabaseQuery(unittest.TestCase):
         self.assertEqual(results[0].id, "005")
 
     def test_query_no_match(self):
-        results = self.db.query_issues(priority="P0", status="pending")
-        self.assertEqual(len(results), 0)
+        self.assertEqual(self.db.count_issues(priority="P0", status="pending"), 0)
 
     def test_query_all(self):
-        results = self.db.query_issues()
-        self.assertEqual(len(results), 5)
+        self.assertEqual(self.db.count_issues(), 5)
+
+    def test_query_order_by_id(self):
+        # 默认按优先级排序，005(P1) 排在 002(P2) 之前
+        self.assertEqual([i.id for i in self.db.query_issues()], ["001", "005", "002", "003", "004"])
+        results = self.db.query_issues(order_by_id=True)
+        self.assertEqual([i.id for i in results], ["001", "002", "003", "004", "005"])
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -358,18 +447,17 @@ class TestDatabaseQuery(unittest.TestCase):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestDatabaseStats(unittest.TestCase):
+class TestDatabaseStats(_SharedDbTestCase):
     """统计功能测试."""
 
     def setUp(self):
-        self.db = _make_db()
-        self.db.add_issue(_sample_issue("001", priority="P0", status="fixed"))
-        self.db.add_issue(_sample_issue("002", priority="P0", status="fixed"))
-        self.db.add_issue(_sample_issue("003", status="pending"))
-        self.db.add_issue(_sample_issue("004", status="n_a"))
-
-    def tearDown(self):
-        self.db.close()
+        super().setUp()
+        _seed_raw(self.db, [
+            _sample_row("001", priority="P0", status="fixed"),
+            _sample_row("002", priority="P0", status="fixed"),
+            _sample_row("003", status="pending"),
+            _sample_row("004", status="n_a"),
+        ])
 
     def test_stats_total(self):
         stats = self.db.get_stats()
@@ -492,16 +580,32 @@ class TestWeldSmartMigrator(unittest.TestCase):
     编号重分配由 cmd_migrate 在写入数据库时执行。
     """
 
-    def setUp(self):
-        self.migrator = WeldSmartMigrator()
+    @classmethod
+    def setUpClass(cls):
+        # migrator 无实例状态，整个测试类共用一个
+        cls.migrator = WeldSmartMigrator()
+        # 样例文本 → 解析结果，每份样例在类内只解析一次
+        cls._parsed: dict[str, list[dict]] = {}
 
     def _parse_from_str(self, content: str) -> list[dict]:
-        """写入临时文件并解析."""
+        """以内存文本流解析，不落盘.
+
+        解析结果按样例缓存，返回深拷贝，用例修改条目字典不影响其他用例。
+        """
+        parsed = self._parsed.get(content)
+        if parsed is None:
+            parsed = self._parsed[content] = self.migrator.parse(io.StringIO(content))
+        return copy.deepcopy(parsed)
+
+    def test_parse_from_path(self):
+        """传入文件路径（str 或 Path）与传入文本流的解析结果一致."""
         fd, path = tempfile.mkstemp(suffix=".md")
         with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(content)
+            f.write(SAMPLE_MD_NORMAL)
         try:
-            return self.migrator.parse(path)
+            expected = self._parse_from_str(SAMPLE_MD_NORMAL)
+            self.assertEqual(self.migrator.parse(path), expected)
+            self.assertEqual(self.migrator.parse(pathlib.Path(path)), expected)
         finally:
             os.unlink(path)
 
@@ -523,23 +627,20 @@ class TestWeldSmartMigrator(unittest.TestCase):
         self.assertIn("内存泄漏", c001["impact"])
         self.assertIn("栈分配", c001["fix_plan"])
 
-    def test_parse_n_a_status(self):
-        issues = self._parse_from_str(SAMPLE_MD_MULTI_STATUS)
-        m025 = next(i for i in issues if i["id"] == "M-025")
-        self.assertEqual(m025["status"], "n_a")
-
-    def test_parse_in_progress_status(self):
-        issues = self._parse_from_str(SAMPLE_MD_MULTI_STATUS)
-        l009 = next(i for i in issues if i["id"] == "L-009")
-        self.assertEqual(l009["status"], "in_progress")
-        self.assertEqual(l009["estimated_hours"], 8.0)
-
-    def test_parse_planned_status(self):
-        issues = self._parse_from_str(SAMPLE_MD_MULTI_STATUS)
-        t001 = next(i for i in issues if i["id"] == "T-001")
-        self.assertEqual(t001["status"], "planned")
-        self.assertEqual(t001["priority"], "P3")  # 由 **优先级** 字段覆盖
-        self.assertEqual(t001["estimated_hours"], 2.0)
+    def test_parse_multi_status(self):
+        """同一份多状态样例只解析一次，按条目分 subTest 断言."""
+        by_id = {i["id"]: i for i in self._parse_from_str(SAMPLE_MD_MULTI_STATUS)}
+        expected = {
+            "M-025": {"status": "n_a"},
+            "L-009": {"status": "in_progress", "estimated_hours": 8.0},
+            # priority 由 **优先级** 字段覆盖
+            "T-001": {"status": "planned", "priority": "P3", "estimated_hours": 2.0},
+        }
+        for issue_id, fields in expected.items():
+            with self.subTest(id=issue_id):
+                self.assertIn(issue_id, by_id)
+                for key, value in fields.items():
+                    self.assertEqual(by_id[issue_id][key], value, key)
 
     def test_parse_multi_file_paths(self):
         issues = self._parse_from_str(SAMPLE_MD_MULTI_FILE)
@@ -580,131 +681,149 @@ class TestWeldSmartMigrator(unittest.TestCase):
 
 
 class TestExporter(unittest.TestCase):
-    """Export 输出格式测试."""
+    """Export 输出格式测试.
 
-    def setUp(self):
-        self.config_path = _write_temp_config(VALID_CONFIG_YAML)
-        self.config = Config(self.config_path)
-        self.db = _make_db()
+    只读的格式断言共用 setUpClass 中导出一次的内容；
+    涉及数据变更或跳过判断的用例各自使用独立数据库与输出目录。
+    """
 
+    @staticmethod
+    def _make_seeded_db() -> Database:
+        db = _make_db()
         # 插入测试数据（纯数字编号）
-        self.db.add_issue(Issue(
-            id="001", title="临界问题", priority="P0", status="fixed",
-            discovery_date="2026-01-19", fix_date="2026-01-19",
-            file_path="src/core/test.cpp", description="临界描述",
-        ))
-        self.db.add_issue(Issue(
-            id="002", title="中等问题", priority="P2", status="pending",
-            discovery_date="2026-02-01", file_path="src/hal/test.cpp",
-            description="中等描述", estimated_hours=2.0,
-        ))
-        self.db.add_issue(Issue(
-            id="003", title="架构问题", priority="P2", status="fixed",
-            discovery_date="2026-02-01", fix_date="2026-02-02",
-            description="架构描述", actual_hours=4.0,
-        ))
-        self.db.add_issue(Issue(
-            id="004", title="测试问题", priority="P3", status="planned",
-            discovery_date="2026-02-03", description="测试描述",
-        ))
-
-    def tearDown(self):
-        self.db.close()
-        os.unlink(self.config_path)
-
-    def test_export_contains_all_issues(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
+        _bulk_add(db, [
+            Issue(
+                id="001", title="临界问题", priority="P0", status="fixed",
+                discovery_date="2026-01-19", fix_date="2026-01-19",
+                file_path="src/core/test.cpp", description="临界描述",
+            ),
+            Issue(
+                id="002", title="中等问题", priority="P2", status="pending",
+                discovery_date="2026-02-01", file_path="src/hal/test.cpp",
+                description="中等描述", estimated_hours=2.0,
+            ),
+            Issue(
+                id="003", title="架构问题", priority="P2", status="fixed",
+                discovery_date="2026-02-01", fix_date="2026-02-02",
+                description="架构描述", actual_hours=4.0,
+            ),
+            Issue(
+                id="004", title="测试问题", priority="P3", status="planned",
+                discovery_date="2026-02-03", description="测试描述",
+            ),
+        ])
+        return db
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = _get_config(VALID_CONFIG_YAML)
+        db = cls._make_seeded_db()
+        tmp_dir = tempfile.mkdtemp()
         try:
-            exporter.export(output_path)
+            output_path = os.path.join(tmp_dir, "issues.md")
+            Exporter(cls.config, db).export(output_path)
             with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # 所有编号应出现
-            self.assertIn("001", content)
-            self.assertIn("002", content)
-            self.assertIn("003", content)
-            self.assertIn("004", content)
+                cls.content = f.read()
+            # 整行标题断言走集合查找，无需逐次扫描全文
+            cls.lines = frozenset(cls.content.splitlines())
         finally:
-            os.unlink(output_path)
+            db.close()
+            shutil.rmtree(tmp_dir)
 
-    def test_export_has_statistics_section(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
-        try:
-            exporter.export(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
+    def _private_env(self) -> tuple[Database, str]:
+        """独立的已填充数据库与输出目录，用例结束时清理."""
+        db = self._make_seeded_db()
+        self.addCleanup(db.close)
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        return db, tmp_dir
 
-            self.assertIn("## 总体统计", content)
-            self.assertIn("按优先级统计", content)
-            self.assertIn("问题概要汇总", content)
-        finally:
-            os.unlink(output_path)
+    def test_export_contains_all_issues(self):
+        # 所有编号应出现
+        self.assertIn("001", self.content)
+        self.assertIn("002", self.content)
+        self.assertIn("003", self.content)
+        self.assertIn("004", self.content)
+
+    def test_export_has_statistics_section(self):
+        self.assertIn("## 总体统计", self.lines)
+        self.assertIn("### 按优先级统计", self.lines)
+        self.assertIn("### 问题概要汇总", self.lines)
 
     def test_export_has_priority_sections(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
-        try:
-            exporter.export(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            self.assertIn("Critical Priority", content)
-            self.assertIn("Medium Priority", content)
-            self.assertIn("Low Priority", content)
-            # 不再有 Architecture/Test 独立段
-            self.assertNotIn("Architecture Issues", content)
-            self.assertNotIn("Test Issues", content)
-        finally:
-            os.unlink(output_path)
+        self.assertIn("Critical Priority", self.content)
+        self.assertIn("Medium Priority", self.content)
+        self.assertIn("Low Priority", self.content)
+        # 不再有 Architecture/Test 独立段
+        self.assertNotIn("Architecture Issues", self.content)
+        self.assertNotIn("Test Issues", self.content)
 
     def test_export_status_emojis(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
-        try:
-            exporter.export(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            self.assertIn("✅ 已修复", content)
-            self.assertIn("❌ 待修复", content)
-            self.assertIn("📋 待规划", content)
-        finally:
-            os.unlink(output_path)
+        self.assertIn("✅ 已修复", self.content)
+        self.assertIn("❌ 待修复", self.content)
+        self.assertIn("📋 待规划", self.content)
 
     def test_export_header_uses_project_name(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
-        try:
-            exporter.export(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            self.assertIn("TestProject", content)
-            # 不应出现硬编码的项目名
-            self.assertNotIn("WeldSmart Pro", content)
-        finally:
-            os.unlink(output_path)
+        self.assertIn("TestProject", self.content)
+        # 不应出现硬编码的项目名
+        self.assertNotIn("WeldSmart Pro", self.content)
 
     def test_export_sequential_numbering_spec(self):
-        exporter = Exporter(self.config, self.db)
-        fd, output_path = tempfile.mkstemp(suffix=".md")
-        os.close(fd)
-        try:
-            exporter.export(output_path)
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # 编号规则说明应为序号模式
-            self.assertIn("全局自动递增序号", content)
-        finally:
-            os.unlink(output_path)
+        # 编号规则说明应为序号模式
+        self.assertIn("全局自动递增序号", self.content)
+
+    def test_format_spec_priority_rows(self):
+        self.assertIn("|--------|------|\n| P0 | ", self.content)
+        # Config 校验不允许空列表，这里用最小替身直接检查模板拼接
+        spec = Exporter(types.SimpleNamespace(valid_priorities=[]), None)._format_spec()
+        self.assertIn("|--------|------|\n\n### 问题条目格式", spec)
+
+    def test_export_skips_when_unchanged(self):
+        """数据未变化时跳过重新生成."""
+        db, tmp_dir = self._private_env()
+        exporter = Exporter(self.config, db)
+        output_path = os.path.join(tmp_dir, "issues.md")
+        exporter.export(output_path)
+
+        # 篡改输出文件，未变化时不应被覆盖
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("stale")
+        exporter.export(output_path)
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "stale")
+
+        # force 时强制重新生成
+        exporter.export(output_path, force=True)
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertIn("TestProject", f.read())
+
+    def test_export_regenerates_after_change(self):
+        """数据变化后重新生成."""
+        db, tmp_dir = self._private_env()
+        exporter = Exporter(self.config, db)
+        output_path = os.path.join(tmp_dir, "issues.md")
+        exporter.export(output_path)
+
+        db.update_issue("002", title="标题已修改")
+        exporter.export(output_path)
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertIn("标题已修改", f.read())
+
+    def test_export_regenerates_after_format_change(self):
+        """导出格式版本变化（如升级后模板改动）时不复用旧文件."""
+        db, tmp_dir = self._private_env()
+        exporter = Exporter(self.config, db)
+        output_path = os.path.join(tmp_dir, "issues.md")
+        exporter.export(output_path)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("stale")
+
+        module = sys.modules[Exporter.__module__]
+        self.addCleanup(setattr, module, "_EXPORT_FORMAT_VERSION", module._EXPORT_FORMAT_VERSION)
+        module._EXPORT_FORMAT_VERSION += 1
+        exporter.export(output_path)
+        with open(output_path, "r", encoding="utf-8") as f:
+            self.assertIn("TestProject", f.read())
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -712,17 +831,24 @@ class TestExporter(unittest.TestCase):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestGithubSync(unittest.TestCase):
+class TestGithubSync(_SharedDbTestCase):
     """GitHub 同步逻辑测试（mock gh 命令）."""
 
     def setUp(self):
-        self.config_path = _write_temp_config(VALID_CONFIG_YAML)
-        self.config = Config(self.config_path)
-        self.db = _make_db()
+        super().setUp()
+        self.config = _get_config(VALID_CONFIG_YAML)
+
+    @staticmethod
+    def _stub_close(syncer, outcome: tuple[bool, str | None]) -> list[tuple]:
+        """以实例属性替换 gh 调用（只影响该 syncer），返回记录调用参数的列表."""
+        calls = []
 
-    def tearDown(self):
-        self.db.close()
-        os.unlink(self.config_path)
+        def fake_close(github_issue_id, comment, repo=None):
+            calls.append((github_issue_id, comment, repo))
+            return outcome
+
+        syncer._close_github_issue = fake_close
+        return calls
 
     def test_sync_dry_run_no_pending(self):
         """无待同步条目时，dry-run 输出正确."""
@@ -743,38 +869,34 @@ class TestGithubSync(unittest.TestCase):
         self.assertEqual(result["success"], 0)
         self.assertEqual(result["failed"], 0)
 
-    @patch("issue_tracker.core.github_sync.GithubSync._close_github_issue")
-    def test_sync_success(self, mock_close):
+    def test_sync_success(self):
         """模拟 gh 关闭成功."""
-        mock_close.return_value = (True, None)
-
         self.db.add_issue(Issue(
             id="001", title="已修复", priority="P2", status="fixed",
             discovery_date="2026-01-01", github_issue_id=42,
         ))
 
         syncer = GithubSync(self.config, self.db)
+        calls = self._stub_close(syncer, (True, None))
         result = syncer.sync(dry_run=False)
 
         self.assertEqual(result["success"], 1)
         self.assertEqual(result["failed"], 0)
-        mock_close.assert_called_once_with(42, "自动同步: 001 已修复", None)
+        self.assertEqual(calls, [(42, "自动同步: 001 已修复", None)])
 
         # 再次同步应无待处理（已记录日志）
         result2 = syncer.sync(dry_run=True)
         self.assertEqual(result2["pending"], 0)
 
-    @patch("issue_tracker.core.github_sync.GithubSync._close_github_issue")
-    def test_sync_failure(self, mock_close):
+    def test_sync_failure(self):
         """模拟 gh 关闭失败."""
-        mock_close.return_value = (False, "网络超时")
-
         self.db.add_issue(Issue(
             id="001", title="已修复", priority="P2", status="fixed",
             discovery_date="2026-01-01", github_issue_id=42,
         ))
 
         syncer = GithubSync(self.config, self.db)
+        self._stub_close(syncer, (False, "网络超时"))
         result = syncer.sync(dry_run=False)
 
         self.assertEqual(result["success"], 0)
@@ -788,14 +910,10 @@ class TestGithubSync(unittest.TestCase):
         """GitHub 禁用时应直接返回."""
         # 修改配置禁用 github
         disabled_yaml = VALID_CONFIG_YAML.replace("enabled: true", "enabled: false")
-        path = _write_temp_config(disabled_yaml)
-        try:
-            config = Config(path)
-            syncer = GithubSync(config, self.db)
-            result = syncer.sync()
-            self.assertEqual(result["pending"], 0)
-        finally:
-            os.unlink(path)
+        config = _get_config(disabled_yaml)
+        syncer = GithubSync(config, self.db)
+        result = syncer.sync()
+        self.assertEqual(result["pending"], 0)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -803,15 +921,9 @@ class TestGithubSync(unittest.TestCase):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-class TestGithubSyncQuery(unittest.TestCase):
+class TestGithubSyncQuery(_SharedDbTestCase):
     """测试 get_pending_github_sync 查询条件."""
 
-    def setUp(self):
-        self.db = _make_db()
-
-    def tearDown(self):
-        self.db.close()
-
     def test_pending_sync_excludes_no_github_id(self):
         """无 github_issue_id 的 fixed 条目不应出现."""
         self.db.add_issue(Issue(
@@ -852,5 +964,255 @@ class TestGithubSyncQuery(unittest.TestCase):
         self.assertEqual(len(pending), 0)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# 项目初始化测试
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class TestProjectInit(unittest.TestCase):
+    """project_init 辅助函数测试."""
+
+    def test_sanitize_name_fast_path_matches_regex(self):
+        """ASCII 名称的 translate 快速路径与正则回退结果一致."""
+        names = [
+            "WeldSmart Pro", "my-project.v2", "__a__b__", "", "a/b\\c:d",
+            "".join(map(chr, range(128))),
+            "焊接 项目-二", "Café_ü", "项目 Pro/2",
+        ]
+        for name in names:
+            with self.subTest(name=name):
+                expected = project_init._NON_WORD_RE.sub("_", name).strip("_")
+                self.assertEqual(project_init._sanitize_name(name), expected)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# iss-ui 缓存逻辑测试
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+def _use_temp_xdg_dirs(test: unittest.TestCase) -> None:
+    """将 XDG 配置/数据/缓存目录指向临时目录，用例结束时恢复环境变量并清理."""
+    tmp_dir = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, tmp_dir)
+    for var, sub in (("XDG_CONFIG_HOME", "config"), ("XDG_DATA_HOME", "data"), ("XDG_CACHE_HOME", "cache")):
+        old = os.environ.get(var)
+        if old is None:
+            test.addCleanup(os.environ.pop, var, None)
+        else:
+            test.addCleanup(os.environ.__setitem__, var, old)
+        os.environ[var] = os.path.join(tmp_dir, sub)
+
+
+def _write_project_config(project_id: str, name: str) -> str:
+    """在 XDG 配置目录写入最小项目配置，返回文件路径."""
+    config_dir = paths.get_config_dir()
+    os.makedirs(config_dir, exist_ok=True)
+    path = os.path.join(config_dir, f"{project_id}_{name}.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'project:\n  id: "{project_id}"\n  name: "{name}"\n')
+    return path
+
+
+class TestProjectScanCache(unittest.TestCase):
+    """项目扫描的磁盘缓存（$XDG_CACHE_HOME/issue-tracker/projects.json）测试."""
+
+    def setUp(self):
+        _use_temp_xdg_dirs(self)
+        self.cache_file = os.path.join(paths.get_cache_dir(), ui._PROJECTS_CACHE_FILE)
+        self.paths = [_write_project_config("001", "Alpha"), _write_project_config("002", "Beta")]
+
+        # 记录 load_yaml 的调用，区分缓存命中与重新解析
+        self.parsed = []
+        real_load_yaml = ui.load_yaml
+
+        def counting_load_yaml(path):
+            self.parsed.append(path)
+            return real_load_yaml(path)
+
+        ui.load_yaml = counting_load_yaml
+        self.addCleanup(setattr, ui, "load_yaml", real_load_yaml)
+        self.addCleanup(ui._invalidate_projects_cache)
+
+    def _scan(self) -> dict[str, str]:
+        """丢弃进程内缓存后扫描，模拟新会话；返回 编号 → 名称."""
+        ui._invalidate_projects_cache()
+        return {p["id"]: p["name"] for p in ui._scan_projects()}
+
+    def test_cache_dir_follows_xdg_cache_home(self):
+        self.assertEqual(
+            paths.get_cache_dir(),
+            os.path.join(os.environ["XDG_CACHE_HOME"], "issue-tracker"),
+        )
+
+    def test_disk_cache_hit(self):
+        self.assertEqual(self._scan(), {"001": "Alpha", "002": "Beta"})
+        self.assertEqual(sorted(self.parsed), sorted(self.paths))
+        self.assertTrue(os.path.isfile(self.cache_file))
+
+        self.parsed.clear()
+        self.assertEqual(self._scan(), {"001": "Alpha", "002": "Beta"})
+        self.assertEqual(self.parsed, [])
+
+    def test_stale_mtime_reparsed(self):
+        self._scan()
+        self.parsed.clear()
+        path = self.paths[1]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('project:\n  id: "002"\n  name: "Gamma"\n')
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self._scan(), {"001": "Alpha", "002": "Gamma"})
+        self.assertEqual(self.parsed, [path])
+
+    def test_corrupt_cache_falls_back_to_parsing(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        self.assertEqual(self._scan(), {"001": "Alpha", "002": "Beta"})
+        self.assertEqual(sorted(self.parsed), sorted(self.paths))
+        # 解析后回写为有效缓存
+        with open(self.cache_file, encoding="utf-8") as f:
+            self.assertEqual(sorted(json.load(f)), sorted(self.paths))
+
+
+class TestGhCommandCache(unittest.TestCase):
+    """_run_gh 结果缓存测试（以 Python 子进程代替 gh）."""
+
+    def _run(self, exit_code: int):
+        args = [sys.executable, "-c", f"import sys; sys.exit({exit_code})"]
+        self.addCleanup(ui._gh_cache.pop, tuple(args), None)
+        return args, ui._run_gh(args, 10)
+
+    def test_success_cached(self):
+        args, result = self._run(0)
+        self.assertEqual(result.returncode, 0)
+        self.assertIs(ui._gh_cache[tuple(args)][1], result)
+        self.assertIs(ui._run_gh(args, 10), result)
+
+    def test_failure_not_cached(self):
+        """失败结果不缓存，下次调用重新执行."""
+        args, result = self._run(1)
+        self.assertEqual(result.returncode, 1)
+        self.assertNotIn(tuple(args), ui._gh_cache)
+        self.assertIsNot(ui._run_gh(args, 10), result)
+
+
+class TestGhRepoPrefetch(unittest.TestCase):
+    """绑定仓库时 gh repo list 的后台预取测试."""
+
+    def setUp(self):
+        _use_temp_xdg_dirs(self)
+        _write_project_config("001", "Alpha")
+        self.addCleanup(ui._invalidate_projects_cache)
+        ui._invalidate_projects_cache()
+
+    def _replace(self, name: str, value) -> None:
+        self.addCleanup(setattr, ui, name, getattr(ui, name))
+        setattr(ui, name, value)
+
+    def test_prefetch_returns_result_and_reraises(self):
+        self.assertEqual(ui._Prefetch(lambda a, b: a + b, 1, 2).result(), 3)
+        with self.assertRaises(FileNotFoundError):
+            ui._Prefetch(lambda: open(os.path.join(tempfile.gettempdir(), "缺失", "x"))).result()
+
+    def test_cancel_at_project_picker_leaves_daemon_thread(self):
+        """在目标项目菜单按 Esc 返回时，未完成的预取不阻塞返回，也不阻塞解释器退出."""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        started = []
+
+        def slow_gh(args, timeout):
+            started.append(threading.current_thread())
+            release.wait(timeout)
+            raise FileNotFoundError(args[0])
+
+        answers = iter([1, None, None])  # 绑定仓库到项目 → Esc（目标项目）→ Esc（退出菜单）
+        self._replace("_run_gh", slow_gh)
+        self._replace("menu", lambda *a, **k: next(answers))
+        ui._github_config_menu()
+
+        self.assertEqual(len(started), 1)
+        self.assertTrue(started[0].daemon)
+        self.assertTrue(started[0].is_alive())
+        release.set()
+        started[0].join(5)
+        self.assertFalse(started[0].is_alive())
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 终端组件测试
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class TestTerminal(unittest.TestCase):
+    """终端基础组件测试（不依赖真实 TTY）."""
+
+    def test_winch_handler_installed_lazily_and_chained(self):
+        """首次测量宽度时才安装 SIGWINCH 处理器，并转交原处理器."""
+        if threading.current_thread() is not threading.main_thread():
+            self.skipTest("信号处理器只能在主线程安装")
+        calls = []
+        original = signal.signal(signal.SIGWINCH, lambda signum, frame: calls.append(signum))
+        self.addCleanup(signal.signal, signal.SIGWINCH, original)
+        saved = (terminal._winch_installed, terminal._prev_winch_handler, terminal._term_width_cache)
+        self.addCleanup(self._restore_winch_state, saved)
+        terminal._winch_installed = None
+        terminal._term_width_cache = None
+
+        self.assertNotEqual(signal.getsignal(signal.SIGWINCH), terminal._on_resize)
+        terminal._term_width()
+        self.assertIs(signal.getsignal(signal.SIGWINCH), terminal._on_resize)
+        self.assertIsNotNone(terminal._term_width_cache)
+
+        signal.raise_signal(signal.SIGWINCH)
+        self.assertIsNone(terminal._term_width_cache)
+        self.assertEqual(calls, [signal.SIGWINCH])
+
+    @staticmethod
+    def _restore_winch_state(saved):
+        terminal._winch_installed, terminal._prev_winch_handler, terminal._term_width_cache = saved
+
+    def _feed(self, data: bytes) -> int:
+        """写入数据并返回管道读端，模拟一次性到达的键盘输入."""
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        os.write(w, data)
+        os.close(w)
+        self.addCleanup(setattr, terminal, "_pending", "")
+        return r
+
+    def test_getch_reads_one_key_without_swallowing_typeahead(self):
+        """普通按键只读一个字节，其后键入的内容仍留在输入流中."""
+        fd = self._feed(b"xhello\n")
+        self.assertEqual(terminal._getch_raw(fd), "x")
+        self.assertEqual(terminal._pending, "")
+        self.assertEqual(os.read(fd, 16), b"hello\n")
+
+    def test_getch_reads_ahead_one_csi_sequence_only(self):
+        fd = self._feed(b"\x1b[Az")
+        self.assertEqual(terminal._getch_raw(fd), terminal.Key.UP)
+        self.assertEqual(terminal._pending, "")
+        self.assertEqual(os.read(fd, 16), b"z")
+
+    def test_getch_pending_cleared_on_raw_mode_exit(self):
+        """ESC + 非 '[' 多读到的字节只在 raw 会话内有效."""
+        fd = self._feed(b"\x1bab")
+        self.assertEqual(terminal._getch_raw(fd), "")
+        self.assertEqual(terminal._pending, "b")
+
+        master, slave = pty.openpty()
+        self.addCleanup(os.close, master)
+        self.addCleanup(os.close, slave)
+        saved_stdin = sys.stdin
+        self.addCleanup(setattr, sys, "stdin", saved_stdin)
+        sys.stdin = types.SimpleNamespace(fileno=lambda: slave)
+        with terminal._RawMode():
+            self.assertEqual(terminal._getch_raw(fd), "b")
+            terminal._pending = "stale"
+        self.assertEqual(terminal._pending, "")
+
+
 if __name__ == "__main__":
     unittest.main()